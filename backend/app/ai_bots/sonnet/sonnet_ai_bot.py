@@ -1,7 +1,8 @@
 from anthropic import Anthropic, HUMAN_PROMPT, AI_PROMPT
 from sqlalchemy.orm import Session
 from app.models.user import User
-from app.models.bet import Bet
+from app.schemas.bet import BetCreate
+from app.api.crud.bet import upsert_bets
 from app.models.game import Game
 from app.models.tournament import Tournament
 from .. import ANTHROPIC_API_KEY, SONNET_BOT_ID, HIDDEN
@@ -89,16 +90,19 @@ class SonnetAIBot:
 
         if prediction:
             ai_user = self._get_or_create_ai_user(db)
-            ai_bet = Bet(
-                game_id=game_id,
-                owner_id=ai_user.id,
-                owner_name=ai_user.username,
-                team1_score=prediction['home_score'],
-                team2_score=prediction['away_score'],
-                hidden=HIDDEN,
+            # Upserted, so predicting a game again replaces the bot's earlier bet
+            [ai_bet] = upsert_bets(
+                db,
+                ai_user,
+                [
+                    BetCreate(
+                        game_id=game_id,
+                        team1_score=prediction['home_score'],
+                        team2_score=prediction['away_score'],
+                        hidden=HIDDEN,
+                    )
+                ],
             )
-            db.add(ai_bet)
-            db.commit()
 
             return ai_bet, prediction['explanation']
         else:
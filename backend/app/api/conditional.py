@@ -0,0 +1,47 @@
+import hashlib
+from datetime import timezone
+from email.utils import format_datetime
+from fastapi import HTTPException, Request, Response
+from app.db.versions import data_versions
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: W/"x" and "x" name the same representation
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def check_data_versions(request: Request, response: Response, families) -> None:
+    """Answer the request with ``304`` when its ETag over ``families`` matches, else set the headers."""
+    versions = data_versions.get(families)
+    fingerprint = "|".join(
+        [request.url.path, request.url.query, request.headers.get("authorization", "")]
+        + [str(version) for version, _ in versions]
+    )
+    etag = f'W/"{hashlib.sha1(fingerprint.encode()).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    modified = [updated_at for _, updated_at in versions if updated_at is not None]
+    if modified:
+        headers["Last-Modified"] = format_datetime(max(modified).replace(tzinfo=timezone.utc), usegmt=True)
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
+
+
+def conditional_get(*families: str):
+    """Dependency answering conditional GETs from the data versions of ``families``.
+
+    The ``ETag`` combines the request URL, the caller's credentials and the versions of every
+    family the response is built from, so a matching ``If-None-Match`` is answered with ``304``
+    before the endpoint runs a single query.
+    """
+
+    async def conditional(request: Request, response: Response):
+        check_data_versions(request, response, families)
+
+    return conditional
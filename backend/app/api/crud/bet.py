@@ -0,0 +1,168 @@
+from datetime import datetime, timedelta
+from fastapi import HTTPException
+from sqlalchemy import Row, select
+from sqlalchemy.orm import Session, aliased
+from app.db.upsert import dialect_insert
+from app.models.bet import Bet
+from app.models.game import Game
+from app.models.team import Team
+from app.models.tournament import Tournament
+from app.models.user import User
+from app.schemas.bet import BetCreate, BetRead
+from app.utils.bet_utils import add_bettors_to_standings
+from app.utils.open_games import open_games
+
+
+def enriched_bets(
+    db: Session, *criteria, order_by=(Game.start_time, Bet.id), limit: int | None = None
+) -> list[BetRead]:
+    """Bets matching ``criteria`` with their game, tournament and team emblems, in one joined query.
+
+    Each team is joined through its own alias, so the two emblems cannot mix up or multiply rows.
+    """
+    home, away = aliased(Team), aliased(Team)
+    rows = db.execute(
+        select(
+            Bet,
+            Game.team1,
+            Game.team2,
+            Game.title,
+            Game.start_time,
+            Game.team1_score,
+            Game.team2_score,
+            Tournament.id,
+            Tournament.name,
+            Tournament.logo,
+            home.emblem,
+            away.emblem,
+        )
+        .join(Game, Bet.game_id == Game.id)
+        .join(Tournament, Game.tournament_id == Tournament.id)
+        .outerjoin(home, Game.team1_id == home.data_id)
+        .outerjoin(away, Game.team2_id == away.data_id)
+        .where(*criteria)
+        .order_by(*order_by)
+        .limit(limit)
+    ).all()
+    return [
+        BetRead.model_validate(bet).model_copy(
+            update={
+                "team1": team1,
+                "team2": team2,
+                "title": title,
+                "start_time": start_time,
+                "actual_team1_score": actual_team1_score,
+                "actual_team2_score": actual_team2_score,
+                "tournament_id": tournament_id,
+                "tournament_name": tournament_name,
+                "tournament_logo": logo,
+                "logo": logo,
+                "team1_emblem": team1_emblem,
+                "team2_emblem": team2_emblem,
+            }
+        )
+        for (
+            bet,
+            team1,
+            team2,
+            title,
+            start_time,
+            actual_team1_score,
+            actual_team2_score,
+            tournament_id,
+            tournament_name,
+            logo,
+            team1_emblem,
+            team2_emblem,
+        ) in rows
+    ]
+
+
+def betting_closed(start_time: datetime) -> bool:
+    """Bets lock at kickoff; ``start_time`` is stored in MSK, three hours ahead of UTC."""
+    return start_time - timedelta(hours=3) <= datetime.utcnow()
+
+
+def bet_response(bet: Row, game: Row) -> BetRead:
+    """Response for a stored bet, enriched from the details of its game without a query."""
+    return BetRead.model_validate(bet).model_copy(
+        update={
+            "team1": game.team1,
+            "team2": game.team2,
+            "title": game.title,
+            "start_time": game.start_time,
+            "tournament_id": game.tournament_id,
+            "tournament_name": game.tournament_name,
+            "tournament_logo": game.tournament_logo,
+            "logo": game.tournament_logo,
+            "team1_emblem": game.team1_emblem,
+            "team2_emblem": game.team2_emblem,
+        }
+    )
+
+
+def place_bets(db: Session, user: User, bets: list[BetCreate]) -> list[BetRead]:
+    """Create or update the user's bets on several games in a single transaction.
+
+    All kickoff times are checked before anything is written, from the open games cache with
+    at most one query; a single unknown or started game rejects the whole batch.
+    """
+    by_game = {bet.game_id: bet for bet in bets}
+    if len(by_game) != len(bets):
+        raise HTTPException(status_code=400, detail="Only one bet per game can be submitted")
+
+    games = open_games.get_many(db, list(by_game))
+    missing = sorted(set(by_game) - set(games))
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Games not found: {missing}")
+    started = sorted(game_id for game_id, game in games.items() if betting_closed(game.start_time))
+    if started:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot place or change bet after the game has started: {started}",
+        )
+
+    stored = upsert_bets(db, user, bets)
+    return sorted(
+        (bet_response(bet, games[bet.game_id]) for bet in stored),
+        key=lambda bet: (bet.start_time, bet.id),
+    )
+
+
+def upsert_bets(db: Session, user: User, bets: list[BetCreate]) -> list[Row]:
+    """Create the user's bets or overwrite the predictions of existing ones, then commit.
+
+    A single ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING`` on the unique
+    ``(game_id, owner_id)`` index, so concurrent submissions cannot create duplicates.
+    The user joins the leaderboards of the games' tournaments with an empty standing.
+    Kickoff times must be checked by the caller. Returns the stored bet rows.
+    """
+    insert = dialect_insert(db)
+    statement = insert(Bet).values(
+        [
+            {
+                "game_id": bet.game_id,
+                "owner_id": user.id,
+                "owner_name": user.username,
+                "team1_score": bet.team1_score,
+                "team2_score": bet.team2_score,
+                "hidden": bet.hidden,
+                "points": 0,
+                "finished": False,
+            }
+            for bet in bets
+        ]
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[Bet.game_id, Bet.owner_id],
+        set_={
+            "team1_score": statement.excluded.team1_score,
+            "team2_score": statement.excluded.team2_score,
+            "hidden": statement.excluded.hidden,
+        },
+    )
+    # Plain rows rather than entities, they stay readable once the commit expires the session
+    stored = db.execute(statement.returning(*Bet.__table__.columns)).all()
+    add_bettors_to_standings(db, Bet.owner_id == user.id, Bet.game_id.in_([bet.game_id for bet in bets]))
+    db.commit()
+    return stored
@@ -0,0 +1,34 @@
+from datetime import datetime, timedelta
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.models.game import Game
+
+
+def game_from_match(match: dict, tournament_id: int) -> dict:
+    """Column values of the ``Game`` for a football-data.org match, kickoff converted to MSK."""
+    return {
+        "data_id": match["id"],
+        "tournament_id": tournament_id,
+        "title": f"{match['stage']} - Matchday: {match['matchday']}",
+        "team1": match["homeTeam"]["name"].rstrip(" FC"),
+        "team1_id": match["homeTeam"]["id"],
+        "start_time": datetime.strptime(match["utcDate"], "%Y-%m-%dT%H:%M:%SZ") + timedelta(hours=3),
+        "team2": match["awayTeam"]["name"].rstrip(" FC"),
+        "team2_id": match["awayTeam"]["id"],
+        "finished": False,
+    }
+
+
+def importable_matches(db: Session, matches: list[dict]) -> list[dict]:
+    """Upstream matches that are not finished and not imported as games yet.
+
+    Only the ids of the candidate matches are looked up, through the unique index on
+    ``games.data_id``, so the check does not grow with the number of games ever stored.
+    """
+    candidates = [match for match in matches if match["status"] != "FINISHED"]
+    if not candidates:
+        return []
+    existing = set(
+        db.execute(select(Game.data_id).where(Game.data_id.in_([match["id"] for match in candidates]))).scalars()
+    )
+    return [match for match in candidates if match["id"] not in existing]
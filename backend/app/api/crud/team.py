@@ -1,5 +1,7 @@
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
-from app.models.team import Team
+from app.db.upsert import dialect_insert
+from app.models.team import Team, tournament_team_association
 from app.models.area import Area
 from app.schemas.team import TeamCreate, TeamUpdate
 from sqlalchemy.orm import joinedload
@@ -55,3 +57,74 @@ def delete_team(db: Session, team_id: int):
         db.delete(db_team)
         db.commit()
     return db_team
+
+
+def sync_tournament_teams(db: Session, tournament_id: int, teams_data: list[dict]) -> int:
+    """Upsert the areas and teams of a football-data.org team list and link them to a tournament.
+
+    Areas and teams are written with one ``INSERT ... ON CONFLICT`` each, whatever the number
+    of teams, and only teams not linked yet are added to the tournament. Teams linked by
+    other means, e.g. when a game was added, are left in place. Teams taken from match
+    payloads come without an area and keep the one they have. The caller commits.
+    Returns the number of newly linked teams.
+    """
+    if not teams_data:
+        return 0
+
+    areas = {
+        team_data["area"]["id"]: {
+            "id": team_data["area"]["id"],
+            "name": team_data["area"]["name"],
+            "code": team_data["area"]["code"],
+            "flag": team_data["area"]["flag"],
+        }
+        for team_data in teams_data
+        if team_data.get("area")
+    }
+    if areas:
+        area_upsert = dialect_insert(db)(Area).values(list(areas.values()))
+        db.execute(
+            area_upsert.on_conflict_do_update(
+                index_elements=[Area.id],
+                set_={column: area_upsert.excluded[column] for column in ("name", "code", "flag")},
+            )
+        )
+
+    # Keyed by data_id: Postgres refuses to update the same row twice in one statement
+    teams = {
+        team_data["id"]: {
+            "data_id": team_data["id"],
+            "name": team_data["name"].rstrip(" FC"),
+            "emblem": team_data["crest"],
+            "area_id": team_data["area"]["id"] if team_data.get("area") else None,
+        }
+        for team_data in teams_data
+    }
+    team_upsert = dialect_insert(db)(Team).values(list(teams.values()))
+    team_ids = set(
+        db.execute(
+            team_upsert.on_conflict_do_update(
+                index_elements=[Team.data_id],
+                set_={
+                    "name": team_upsert.excluded.name,
+                    "emblem": team_upsert.excluded.emblem,
+                    "area_id": func.coalesce(team_upsert.excluded.area_id, Team.area_id),
+                },
+            ).returning(Team.id)
+        ).scalars()
+    )
+
+    linked = set(
+        db.execute(
+            select(tournament_team_association.c.team_id).where(
+                tournament_team_association.c.tournament_id == tournament_id
+            )
+        ).scalars()
+    )
+    missing = team_ids - linked
+    if missing:
+        db.execute(
+            insert(tournament_team_association),
+            [{"tournament_id": tournament_id, "team_id": team_id} for team_id in sorted(missing)],
+        )
+    return len(missing)
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query
 from sqlalchemy.orm import Session
 from app.db.database import get_db
 from app.models.user import User
@@ -7,6 +8,7 @@ from app.models.admin import NotificationLog
 from app.models.tournament import Tournament
 from app.notifications.send import send_notifications
 from app.core.security import get_current_user
+from app.utils.rescore import rescore_bets
 
 
 router = APIRouter()
@@ -48,3 +50,17 @@ async def notify_new_games(
     background_tasks.add_task(send_notifications, new_games, users, db)
 
     return {"detail": "Notification task started in the background."}
+
+
+@router.post("/admin/rescore")
+def rescore(
+    tournament_id: Optional[int] = Query(None, description="Rescore one tournament, all of them if omitted"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    if tournament_id is not None and not db.query(Tournament).filter(Tournament.id == tournament_id).first():
+        raise HTTPException(status_code=404, detail="Tournament not found")
+
+    return rescore_bets(db, tournament_id=tournament_id)
@@ -1,19 +1,25 @@
 from typing import Optional
-from fastapi import APIRouter, HTTPException, Depends, Query
-from datetime import datetime, timedelta
-from sqlalchemy import exists
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from app.utils.open_games import open_games
 from app.db.database import get_db
 from app.models.bet import Bet
 from app.schemas.bet import BetCreate, BetRead, BetUpdate
 from app.models.tournament import Tournament
 from app.models.user import User
 from app.models.game import Game
-from app.models.team import Team
 from app.core.security import get_current_user
+from app.api.conditional import conditional_get
+from app.api.crud.bet import bet_response, betting_closed, enriched_bets, place_bets, upsert_bets
+from app.db.versions import TOURNAMENTS, GAMES, BETS, TEAMS
 
 router = APIRouter()
 
+BETS_PAGE_SIZE = 100
+BETS_MAX_PAGE_SIZE = 1000
+NEXT_CURSOR_HEADER = "X-Next-After-Id"
+
 
 @router.post("/bets", response_model=BetRead)
 async def create_bet(
@@ -21,52 +27,30 @@ async def create_bet(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    user_id = current_user.id
-    user_name = current_user.username
-    db_game = db.query(Game).filter(Game.id == bet.game_id).first()
+    db_game = open_games.get(db, bet.game_id)
     if not db_game:
         raise HTTPException(status_code=404, detail="Game not found")
-    if db_game.start_time - timedelta(hours=3) <= datetime.utcnow():
+    if betting_closed(db_game.start_time):
         raise HTTPException(
             status_code=400,
             detail="Cannot place or change bet after the game has started",
         )
 
-    # Check if the user has already placed a bet on this game
-    if db.query(exists().where(Bet.game_id == bet.game_id).where(Bet.owner_id == user_id)).scalar():
-        raise HTTPException(
-            status_code=400,
-            detail="You have already placed a bet on this game",
-        )
+    # Creates the bet or, on a repeated submission, overwrites the prediction
+    [stored] = upsert_bets(db, current_user, [bet])
+    return bet_response(stored, db_game)
+
 
-    new_bet = Bet(
-        game_id=bet.game_id,
-        owner_id=user_id,
-        owner_name=user_name,
-        team1_score=bet.team1_score,
-        team2_score=bet.team2_score,
-        hidden=bet.hidden,
-        points=0,
-    )
-    db.add(new_bet)
-    db.commit()
-    db.refresh(new_bet)
-
-    # Fetch team emblems from the Team model
-    team1 = db.query(Team).filter(Team.data_id == db_game.team1_id).first()
-    team2 = db.query(Team).filter(Team.data_id == db_game.team2_id).first()
-
-    bet_response = BetRead.model_validate(new_bet)
-    bet_response.start_time = db_game.start_time
-    bet_response.team1 = db_game.team1
-    bet_response.team2 = db_game.team2
-    bet_response.team1_emblem = team1.emblem
-    bet_response.team2_emblem = team2.emblem
-    bet_response.tournament_name = db_game.tournament.name
-    bet_response.tournament_logo = db_game.tournament.logo
-    bet_response.title = db_game.title
-
-    return bet_response
+@router.post("/bets/batch", response_model=list[BetRead])
+async def create_bets(
+    bets: list[BetCreate],
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Place or change the current user's bets on several games at once, e.g. a whole matchday."""
+    if not bets:
+        raise HTTPException(status_code=400, detail="No bets submitted")
+    return place_bets(db, current_user, bets)
 
 
 @router.put("/bets/{bet_id}", response_model=BetRead)
@@ -76,107 +60,61 @@ async def update_bet(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    db_bet = (
-        db.query(Bet)
-        .filter(
-            Bet.id == bet_id,
-            Bet.owner_id == current_user.id,
-        )
-        .first()
-    )
-    if not db_bet:
+    game_id = db.scalar(select(Bet.game_id).where(Bet.id == bet_id, Bet.owner_id == current_user.id))
+    if game_id is None:
         raise HTTPException(status_code=404, detail="Bet not found")
 
-    db_game = db.query(Game).filter(Game.id == db_bet.game_id).first()
-    if db_game.start_time - timedelta(hours=3) <= datetime.utcnow():
+    db_game = open_games.get(db, game_id)
+    if betting_closed(db_game.start_time):
         raise HTTPException(
             status_code=400,
             detail="Cannot place or change bet after the game has started",
         )
 
     # Update the bet
-    db_bet.team1_score = bet.team1_score
-    db_bet.team2_score = bet.team2_score
-    db_bet.hidden = bet.hidden
-    db.commit()
-    db.refresh(db_bet)
-
-    # Fetch team emblems from the Team model
-    team1 = db.query(Team).filter(Team.data_id == db_game.team1_id).first()
-    team2 = db.query(Team).filter(Team.data_id == db_game.team2_id).first()
-
-    # Fetch additional details for response
-    bet_response = BetRead.model_validate(db_bet)
-    bet_response.start_time = db_game.start_time
-    bet_response.team1 = db_game.team1
-    bet_response.team2 = db_game.team2
-    bet_response.team1_emblem = team1.emblem
-    bet_response.team2_emblem = team2.emblem
-    bet_response.tournament_name = db_game.tournament.name
-    bet_response.tournament_logo = db_game.tournament.logo
-    bet_response.title = db_game.title
-
-    return bet_response
-
-
-@router.get("/bets", response_model=list[BetRead])
+    [stored] = upsert_bets(db, current_user, [BetCreate(game_id=game_id, **bet.model_dump())])
+    return bet_response(stored, db_game)
+
+
+@router.get(
+    "/bets",
+    response_model=list[BetRead],
+    dependencies=[Depends(conditional_get(BETS, GAMES, TOURNAMENTS, TEAMS))],
+)
 async def get_bets(
+    response: Response,
     user_id: Optional[int] = Query(None, description="Filter by user ID"),
     game_id: Optional[int] = Query(None, description="Filter by game ID"),
     tournament_id: Optional[int] = Query(None, description="Filter by tournament ID"),
+    after_id: Optional[int] = Query(None, description="Return bets with a greater ID, the cursor of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, le=BETS_MAX_PAGE_SIZE, description="Page size, all bets if not paging"),
     db: Session = Depends(get_db),
     # current_user: User = Depends(get_current_user),
 ):
-    # Explicitly define join conditions
-    query = db.query(Bet) \
-        .join(Game, Bet.game_id == Game.id) \
-        .join(Tournament, Game.tournament_id == Tournament.id) \
-        .join(Team, Game.team1_id == Team.data_id, isouter=True) \
-        .join(Team, Game.team2_id == Team.data_id, isouter=True)
+    """Bets in ID order, paged when ``limit`` or ``after_id`` is given.
 
+    Pages end with an ``X-Next-After-Id`` header holding the cursor of the next page.
+    """
+    criteria = []
     if user_id:
-        query = query.filter(Bet.owner_id == user_id)
-
+        criteria.append(Bet.owner_id == user_id)
     if game_id:
-        query = query.filter(Bet.game_id == game_id)
-
+        criteria.append(Bet.game_id == game_id)
     if tournament_id:
-        query = query.filter(Game.tournament_id == tournament_id)
-
-    # Select the necessary fields to avoid fetching too much data
-    bets = query.with_entities(
-        Bet,
-        Game.team1.label("team1"),
-        Game.team1.label("team1"),
-        Game.team2.label("team2"),
-        Game.title.label("title"),
-        Game.team1_score.label("team1_score"),
-        Game.team2_score.label("team2_score"),
-        Game.start_time.label("start_time"),
-        Tournament.name.label("tournament_name"),
-        Tournament.logo.label("logo"),
-        Tournament.id.label("tournament_id"),
-        Team.emblem.label("team1_emblem"),
-        Team.emblem.label("team2_emblem")
-    ).all()
-
-    # Enrich the Bet objects with the additional data
-    enriched_bets = []
-    for bet, team1, team2, title, team1_score, team2_score, start_time, tournament_name, logo, tournament_id, team1_emblem, team2_emblem in bets:
-        bet.team1 = team1
-        bet.team2 = team2
-        bet.title = title
-        bet.actual_team1_score = team1_score
-        bet.actual_team2_score = team2_score
-        bet.start_time = str(start_time)
-        bet.tournament_name = tournament_name
-        bet.logo = logo
-        bet.tournament_id = tournament_id
-        bet.team1_emblem = team1_emblem
-        bet.team2_emblem = team2_emblem
-        enriched_bets.append(bet)
-
-    return enriched_bets
+        criteria.append(Game.tournament_id == tournament_id)
+    if after_id:
+        criteria.append(Bet.id > after_id)
+
+    if limit is None and after_id is None:
+        return enriched_bets(db, *criteria, order_by=(Bet.id,))
+
+    limit = limit or BETS_PAGE_SIZE
+    # One extra row tells whether another page follows
+    bets = enriched_bets(db, *criteria, order_by=(Bet.id,), limit=limit + 1)
+    if len(bets) > limit:
+        bets = bets[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = str(bets[-1].id)
+    return bets
 
 
 @router.get("/bets/{bet_id}", response_model=BetRead)
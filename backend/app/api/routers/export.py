@@ -0,0 +1,182 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Iterator, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, exists, select
+from app.core.security import get_current_user
+from app.db.database import SessionLocal
+from app.models.bet import Bet
+from app.models.game import Game
+from app.models.tournament import Tournament
+from app.models.user import User
+from app.utils.bet_utils import standings_select
+
+router = APIRouter()
+
+EXPORT_BATCH_SIZE = 1000
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+ExportFormat = Literal["ndjson", "csv"]
+
+
+def json_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot export {type(value).__name__}")
+
+
+def export_lines(statement: Select, export_format: ExportFormat) -> Iterator[str]:
+    """Rows of ``statement`` as NDJSON or CSV, one chunk per batch of rows.
+
+    The response outlives the request's session, so the export opens its own and reads
+    through a server-side cursor, ``EXPORT_BATCH_SIZE`` rows at a time.
+    """
+    db = SessionLocal()
+    try:
+        result = db.execute(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if export_format == "csv":
+            writer.writerow(result.keys())
+            yield buffer.getvalue()
+        for rows in result.partitions():
+            buffer.seek(0)
+            buffer.truncate()
+            if export_format == "csv":
+                writer.writerows(rows)
+            else:
+                for row in rows:
+                    buffer.write(json.dumps(row._asdict(), default=json_value) + "\n")
+            yield buffer.getvalue()
+    finally:
+        db.close()
+
+
+def export_response(statement: Select, export_format: ExportFormat, name: str) -> StreamingResponse:
+    return StreamingResponse(
+        export_lines(statement, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{export_format}"'},
+    )
+
+
+def kickoff_criteria(since: Optional[datetime], until: Optional[datetime]) -> list:
+    criteria = []
+    if since:
+        criteria.append(Game.start_time >= since)
+    if until:
+        criteria.append(Game.start_time < until)
+    return criteria
+
+
+def require_admin(current_user: User = Depends(get_current_user)) -> User:
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return current_user
+
+
+@router.get("/export/bets", dependencies=[Depends(require_admin)])
+async def export_bets(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    tournament_id: Optional[int] = Query(None, description="Filter by tournament ID"),
+    user_id: Optional[int] = Query(None, description="Filter by user ID"),
+    since: Optional[datetime] = Query(None, description="Games kicking off at or after this MSK time"),
+    until: Optional[datetime] = Query(None, description="Games kicking off before this MSK time"),
+):
+    criteria = kickoff_criteria(since, until)
+    if tournament_id:
+        criteria.append(Game.tournament_id == tournament_id)
+    if user_id:
+        criteria.append(Bet.owner_id == user_id)
+    statement = (
+        select(
+            Bet.id,
+            Bet.game_id,
+            Game.tournament_id,
+            Tournament.name.label("tournament_name"),
+            Game.start_time,
+            Game.team1,
+            Game.team2,
+            Bet.owner_id,
+            Bet.owner_name,
+            Bet.team1_score,
+            Bet.team2_score,
+            Game.team1_score.label("actual_team1_score"),
+            Game.team2_score.label("actual_team2_score"),
+            Bet.points,
+            Bet.finished,
+            Bet.hidden,
+        )
+        .join(Game, Bet.game_id == Game.id)
+        .join(Tournament, Game.tournament_id == Tournament.id)
+        .where(*criteria)
+        .order_by(Bet.id)
+    )
+    return export_response(statement, export_format, "bets")
+
+
+@router.get("/export/games", dependencies=[Depends(require_admin)])
+async def export_games(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    tournament_id: Optional[int] = Query(None, description="Filter by tournament ID"),
+    user_id: Optional[int] = Query(None, description="Only games the user bet on"),
+    since: Optional[datetime] = Query(None, description="Games kicking off at or after this MSK time"),
+    until: Optional[datetime] = Query(None, description="Games kicking off before this MSK time"),
+):
+    criteria = kickoff_criteria(since, until)
+    if tournament_id:
+        criteria.append(Game.tournament_id == tournament_id)
+    if user_id:
+        criteria.append(exists().where(Bet.game_id == Game.id, Bet.owner_id == user_id))
+    statement = (
+        select(
+            Game.id,
+            Game.data_id,
+            Game.tournament_id,
+            Tournament.name.label("tournament_name"),
+            Game.title,
+            Game.start_time,
+            Game.team1,
+            Game.team2,
+            Game.team1_score,
+            Game.team2_score,
+            Game.finished,
+        )
+        .join(Tournament, Game.tournament_id == Tournament.id)
+        .where(*criteria)
+        .order_by(Game.start_time, Game.id)
+    )
+    return export_response(statement, export_format, "games")
+
+
+@router.get("/export/standings", dependencies=[Depends(require_admin)])
+async def export_standings(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    tournament_id: Optional[int] = Query(None, description="Filter by tournament ID"),
+    user_id: Optional[int] = Query(None, description="Filter by user ID"),
+    since: Optional[datetime] = Query(None, description="Count games kicking off at or after this MSK time"),
+    until: Optional[datetime] = Query(None, description="Count games kicking off before this MSK time"),
+):
+    """Points and tiebreaker counts per tournament and user, over the settled games of the date range."""
+    criteria = kickoff_criteria(since, until)
+    if tournament_id:
+        criteria.append(Game.tournament_id == tournament_id)
+    if user_id:
+        criteria.append(Bet.owner_id == user_id)
+    standings = standings_select(*criteria).subquery()
+    statement = (
+        select(standings.c.tournament_id, standings.c.user_id, User.username, *list(standings.c)[2:])
+        .join(User, User.id == standings.c.user_id)
+        .order_by(
+            standings.c.tournament_id,
+            standings.c.total_points.desc(),
+            standings.c.exact_score_count.desc(),
+            standings.c.goal_difference_count.desc(),
+            standings.c.correct_outcome_count.desc(),
+            standings.c.user_id,
+        )
+    )
+    return export_response(statement, export_format, "standings")
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, HTTPException, Depends, Query, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, Query, BackgroundTasks, Request, Response
 from typing import Optional
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from sqlalchemy.orm import joinedload
+from sqlalchemy import exists, func, select, tuple_, update
+from sqlalchemy.orm import joinedload, noload, selectinload
 from datetime import datetime, timedelta
 from app.db.database import get_db
 from app.models.game import Game
@@ -15,12 +17,25 @@ from app.models.tournament import Tournament
 from app.core.security import get_current_user
 from app.notifications.send import send_notifications
 from app.api.crud.team import create_team
+from app.api.crud.game import game_from_match
 from app.football_data.api import FootballDataAPI, get_football_data_api
 from app.ai_bots.sonnet.sonnet_ai_bot import SonnetAIBot
-from app.utils.bet_utils import process_bets_for_finished_game
+from app.utils.bet_utils import rebuild_standings, settle_games
+from app.scheduler.jobs import wake_game_statuses
+from app.api.conditional import check_data_versions
+from app.api.snapshots import snapshot_response
+from app.db.versions import TOURNAMENTS, GAMES, BETS, TEAMS
 
 router = APIRouter()
 
+# Families the game payloads are built from, bets only count when they are expanded
+GAME_READ_FAMILIES = (GAMES, BETS, TOURNAMENTS, TEAMS)
+GAME_LIST_FAMILIES = (GAMES, TOURNAMENTS, TEAMS)
+GAME_LIST_ADAPTER = TypeAdapter(list[GameRead])
+GAME_FIELDS = set(GameRead.model_fields) - {"bets"}
+GAMES_MAX_PAGE_SIZE = 1000
+NEXT_GAMES_HEADER = "X-Next-After"
+
 
 @router.post("/games", response_model=GameRead)
 async def create_game(
@@ -83,17 +98,7 @@ async def create_game(
                 if team_id not in [t.data_id for t in tournament.teams]:
                     tournament.teams.append(db_team)
 
-            new_game = Game(
-                data_id=game.data_id,
-                tournament_id=game.tournament_id,
-                title=f"{game_data['stage']} - Matchday: {game_data['matchday']}",
-                team1=game_data["homeTeam"]["name"].rstrip(" FC"),
-                team1_id=team1_id,
-                start_time=datetime.strptime(game_data["utcDate"], "%Y-%m-%dT%H:%M:%SZ") + timedelta(hours=3),
-                team2=game_data["awayTeam"]["name"].rstrip(" FC"),
-                team2_id=team2_id,
-                finished=False,
-            )
+            new_game = Game(**game_from_match(game_data, game.tournament_id))
         else:
             new_game = Game(
                 tournament_id=game.tournament_id,
@@ -115,6 +120,7 @@ async def create_game(
     db.add(new_game)
     db.commit()
     db.refresh(new_game)
+    wake_game_statuses(db)
 
     background_tasks.add_task(send_notifications, [(new_game, tournament.name)], [], db)
     print("PREDICTION STARTED")
@@ -125,23 +131,130 @@ async def create_game(
     return new_game
 
 
-@router.get("/games", response_model=list[GameRead])
+async def conditional_game_list(request: Request, response: Response, expand: Optional[str] = Query(None)):
+    # Plain game lists do not change when bets are placed, only expanded ones do
+    families = GAME_READ_FAMILIES if "bets" in parse_game_expand(expand) else GAME_LIST_FAMILIES
+    check_data_versions(request, response, families)
+
+
+@router.get(
+    "/games",
+    response_model=list[GameRead],
+    dependencies=[Depends(conditional_game_list)],
+)
 async def get_games(
+    response: Response,
     finished: Optional[bool] = Query(None),
+    tournament_id: Optional[int] = Query(None, description="Filter by tournament ID"),
+    since: Optional[datetime] = Query(None, description="Games kicking off at or after this MSK time"),
+    until: Optional[datetime] = Query(None, description="Games kicking off before this MSK time"),
+    after: Optional[str] = Query(None, description="Cursor of the previous page, from the X-Next-After header"),
+    limit: Optional[int] = Query(None, ge=1, le=GAMES_MAX_PAGE_SIZE, description="Page size, all games if omitted"),
+    fields: Optional[str] = Query(None, description="Comma separated game fields to return"),
+    expand: Optional[str] = Query(None, description="Comma separated nested data to include: bets"),
     db: Session = Depends(get_db),
     # current_user: User = Depends(get_current_user),
 ):
+    """Games in kickoff order, bets only when expanded.
+
+    With ``limit`` the games come one page at a time and the ``X-Next-After`` header holds
+    the cursor of the next page. Full lists are served from the snapshot cache.
+    """
+    with_bets = "bets" in parse_game_expand(expand)
+    include = parse_game_fields(fields, with_bets)
+    cursor = parse_game_cursor(after)
+
+    def render(games: list[GameRead]) -> bytes:
+        if include:
+            return GAME_LIST_ADAPTER.dump_json(games, include={"__all__": include})
+        return GAME_LIST_ADAPTER.dump_json(games, exclude=None if with_bets else {"__all__": {"bets"}})
+
+    criteria = (finished, tournament_id, since, until, cursor)
+    if limit is None:
+        return snapshot_response(
+            ("games", criteria, include and frozenset(include), with_bets),
+            GAME_READ_FAMILIES if with_bets else GAME_LIST_FAMILIES,
+            lambda: render(read_games(db, *criteria, with_bets=with_bets)),
+            response,
+        )
+
+    # One extra game tells whether another page follows
+    games = read_games(db, *criteria, limit=limit + 1, with_bets=with_bets)
+    if len(games) > limit:
+        games = games[:limit]
+        response.headers[NEXT_GAMES_HEADER] = f"{games[-1].start_time.isoformat()},{games[-1].id}"
+    return Response(content=render(games), media_type="application/json", headers=dict(response.headers))
+
+
+def parse_game_expand(expand: Optional[str]) -> set[str]:
+    requested = {part.strip() for part in (expand or "").split(",") if part.strip()}
+    unknown = requested - {"bets"}
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown expand value(s): {', '.join(sorted(unknown))}")
+    return requested
+
+
+def parse_game_fields(fields: Optional[str], with_bets: bool) -> Optional[set[str]]:
+    """Validate a comma separated ``fields`` projection, ``None`` when every field is wanted."""
+    requested = {part.strip() for part in (fields or "").split(",") if part.strip()}
+    if not requested:
+        return None
+    unknown = requested - GAME_FIELDS
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown field(s): {', '.join(sorted(unknown))}")
+    if with_bets:
+        requested.add("bets")
+    return requested
+
+
+def parse_game_cursor(after: Optional[str]) -> Optional[tuple[datetime, int]]:
+    if after is None:
+        return None
+    try:
+        start_time, game_id = after.rsplit(",", 1)
+        return datetime.fromisoformat(start_time), int(game_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def read_games(
+    db: Session,
+    finished: Optional[bool] = None,
+    tournament_id: Optional[int] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    after: Optional[tuple[datetime, int]] = None,
+    limit: Optional[int] = None,
+    with_bets: bool = False,
+    open_for: Optional[int] = None,
+) -> list[GameRead]:
     query = db.query(Game).options(
         joinedload(Game.tournament),
         joinedload(Game.team1_info),
         joinedload(Game.team2_info),
-        joinedload(Game.bets)
+        # A separate query keeps the page limit on games rather than on game and bet rows
+        selectinload(Game.bets) if with_bets else noload(Game.bets),
     )
 
     if finished is not None:
         query = query.filter(Game.finished == finished)
+    if tournament_id is not None:
+        query = query.filter(Game.tournament_id == tournament_id)
+    if since is not None:
+        query = query.filter(Game.start_time >= since)
+    if until is not None:
+        query = query.filter(Game.start_time < until)
+    if after is not None:
+        query = query.filter(tuple_(Game.start_time, Game.id) > tuple_(*after))
+    if open_for is not None:
+        # Betting window still open and no bet of the user yet, an anti-join on uq_bets_game_owner
+        query = query.filter(
+            Game.finished == False,
+            Game.start_time > datetime.utcnow() + timedelta(hours=3),
+            ~exists().where(Bet.game_id == Game.id, Bet.owner_id == open_for),
+        )
 
-    games = query.all()
+    games = query.order_by(Game.start_time, Game.id).limit(limit).all()
     result = []
     for game in games:
         game_data = GameRead.model_validate(game)
@@ -168,6 +281,22 @@ async def get_games(
     return result
 
 
+@router.get("/games/open", response_model=list[GameRead])
+async def get_open_games(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Games the current user can still bet on and has not yet, in kickoff order.
+
+    Not cached or answered with ``304``: games leave the list at kickoff without any write.
+    """
+    games = read_games(db, open_for=current_user.id)
+    return Response(
+        content=GAME_LIST_ADAPTER.dump_json(games, exclude={"__all__": {"bets"}}),
+        media_type="application/json",
+    )
+
+
 @router.get("/games/{game_id}", response_model=GameRead)
 async def get_game(game_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     game = db.query(Game).filter(Game.id == game_id).first()
@@ -212,12 +341,29 @@ async def delete_game(
     if not db_game:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    # Delete all bets associated with this game
-    db.query(Bet).filter(Bet.game_id == game_id).delete()
+    # Take the points of settled bets back from their owners, then delete all bets of this game
+    game_points = (
+        select(Bet.owner_id, func.sum(Bet.points).label("points"))
+        .where(Bet.game_id == game_id, Bet.finished == True)
+        .group_by(Bet.owner_id)
+        .subquery()
+    )
+    db.execute(
+        update(User)
+        .where(User.id == game_points.c.owner_id)
+        .values(total_points=User.total_points - game_points.c.points)
+        .execution_options(synchronize_session=False)
+    )
+    deleted_bets = db.query(Bet).filter(Bet.game_id == game_id).delete()
 
     # Now delete the game
     db.delete(db_game)
+    if deleted_bets:
+        # The standings still count the deleted bets and list players who only bet on this game
+        db.flush()
+        rebuild_standings(db, db_game.tournament_id)
     db.commit()
+    wake_game_statuses(db)
     return db_game
 
 
@@ -240,9 +386,10 @@ async def finish_game(
     if db_game.start_time - timedelta(hours=3) > datetime.utcnow():
         raise HTTPException(status_code=400, detail="Cannot finish not started game")
 
-    process_bets_for_finished_game(db, db_game)
+    if not settle_games(db, [db_game.id]):
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Game is already being settled")
 
-    db_game.finished = True
     db.commit()
     db.refresh(db_game)
 
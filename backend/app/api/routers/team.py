@@ -6,6 +6,8 @@ from app.schemas.team import TeamCreate, TeamUpdate, TeamRead, Area, AreaRead
 from app.api.crud.team import create_team, get_team, get_teams, update_team, delete_team
 from app.football_data.api import FootballDataAPI, get_football_data_api
 from app.core.security import get_current_user
+from app.api.conditional import conditional_get
+from app.db.versions import TOURNAMENTS, TEAMS
 
 
 router = APIRouter()
@@ -75,7 +77,7 @@ async def read_team(
     return team_response
 
 
-@router.get("/teams", response_model=list[TeamRead])
+@router.get("/teams", response_model=list[TeamRead], dependencies=[Depends(conditional_get(TEAMS, TOURNAMENTS))])
 async def read_teams(
     skip: int = 0,
     limit: int = 100,
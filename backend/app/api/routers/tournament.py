@@ -1,23 +1,33 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
-from sqlalchemy import desc, func
-from sqlalchemy.orm import Session, joinedload
+from pydantic import TypeAdapter
+from sqlalchemy import delete, distinct, exists, func, insert, literal, select
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import SQLAlchemyError
 from app.db.database import get_db
 from app.models.tournament import Tournament
-from app.schemas.tournament import TournamentCreate, TournamentRead
-from app.schemas.user import UserPoints
+from app.schemas.tournament import TournamentCreate, TournamentRead, TournamentSummary
+from app.schemas.user import UserPoints, LiveUserPoints
 from app.schemas.bet import BetRead
 from app.schemas.game import GameRead
+from app.schemas.team import TeamReadSimple
 from app.models.user import User
 from app.models.game import Game
 from app.models.bet import Bet
 from app.models.prize import Prize
-from app.models.team import Team
-from app.models.area import Area
+from app.models.standing import TournamentStanding
+from app.models.team import Team, tournament_team_association
 from app.core.security import get_current_user
 from app.football_data.api import FootballDataAPI, get_football_data_api
+from app.api.crud.team import sync_tournament_teams
+from app.api.crud.game import importable_matches
+from app.utils.bet_utils import ranked_standings_select
+from app.utils.live_standings import provisional_standings
+from app.api.conditional import conditional_get
+from app.api.snapshots import snapshot_response
+from app.db.versions import TOURNAMENTS, GAMES, BETS, TEAMS
+from app.scheduler.schedule import msk_now
 
 router = APIRouter()
 security = HTTPBearer(scheme_name="Bearer", description="Enter your JWT token", auto_error=False)
@@ -80,45 +90,8 @@ async def create_tournament(
     # Fetch teams associated with the tournament from the external API
     teams_data = await football_api.get_teams(competition_id=new_tournament.data_id)
     if teams_data:
-        for team_data in teams_data.get("teams", []):
-            # Check if the area for the team exists in the database
-            area = db.query(Area).filter(Area.id == team_data["area"]["id"]).first()
-
-            if not area:
-                # If the area doesn't exist, create a new entry
-                area = Area(
-                    id=team_data["area"]["id"],
-                    name=team_data["area"]["name"],
-                    code=team_data["area"]["code"],
-                    flag=team_data["area"]["flag"],
-                )
-                db.add(area)
-                db.commit()  # Commit the new area to the database
-
-            # Check if the team already exists in the database
-            existing_team = db.query(Team).filter(Team.data_id == team_data["id"]).first()
-
-            if existing_team:
-                # If the team already exists, update the details
-                existing_team.name = team_data["name"].rstrip(" FC")
-                existing_team.emblem = team_data["crest"]
-                existing_team.area_id = area.id
-                db.add(existing_team)
-                new_tournament.teams.append(existing_team)
-            else:
-                # If the team does not exist, create a new entry
-                new_team = Team(
-                    data_id=team_data["id"],
-                    name=team_data["name"].rstrip(" FC"),
-                    emblem=team_data["crest"],
-                    area_id=area.id,
-                )
-                db.add(new_team)
-
-                # Associate the team with the tournament
-                new_tournament.teams.append(new_team)
-
-        db.commit()  # Commit the changes to the database
+        sync_tournament_teams(db, new_tournament.id, teams_data.get("teams", []))
+        db.commit()
 
     return new_tournament
 
@@ -137,17 +110,46 @@ async def create_tournament(
 #     return tournaments
 
 
-@router.get("/tournaments", response_model=list[TournamentRead])
+# Families the full tournament payloads are built from
+TOURNAMENT_READ_FAMILIES = (TOURNAMENTS, GAMES, BETS, TEAMS)
+TOURNAMENT_LIST_ADAPTER = TypeAdapter(list[TournamentRead])
+
+
+def tournament_read_options():
+    """Loader options for rendering ``TournamentRead`` with nested games and bets.
+
+    Each relationship is fetched with its own ``SELECT ... WHERE ... IN`` over the parent
+    keys, so a listing costs one query per relationship however many tournaments, games
+    and bets there are, instead of a joined row per game, prize and team combination.
+    """
+    return (
+        selectinload(Tournament.games).selectinload(Game.bets),
+        selectinload(Tournament.prizes),
+        selectinload(Tournament.teams).selectinload(Team.area),
+    )
+
+
+@router.get(
+    "/tournaments",
+    response_model=list[TournamentRead],
+    dependencies=[Depends(conditional_get(*TOURNAMENT_READ_FAMILIES))],
+)
 async def get_tournaments(
+    response: Response,
     finished: Optional[bool] = Query(None),
     db: Session = Depends(get_db),
 ):
-    query = db.query(Tournament).options(
-        joinedload(Tournament.games),
-        joinedload(Tournament.prizes),
-        joinedload(Tournament.teams).joinedload(Team.area)
+    return snapshot_response(
+        ("tournaments", finished),
+        TOURNAMENT_READ_FAMILIES,
+        lambda: TOURNAMENT_LIST_ADAPTER.dump_json(read_tournaments(db, finished)),
+        response,
     )
 
+
+def read_tournaments(db: Session, finished: Optional[bool] = None) -> list[TournamentRead]:
+    query = db.query(Tournament).options(*tournament_read_options())
+
     if finished is not None:
         query = query.filter(Tournament.finished == finished)
 
@@ -187,18 +189,141 @@ async def get_tournaments(
     return result
 
 
-@router.get("/tournaments/{tournament_id}", response_model=TournamentRead)
-async def get_tournament(
+SUMMARY_EXPANSIONS = {"games", "bets", "teams"}
+
+
+def parse_expand(expand: Optional[str]) -> set[str]:
+    """Validate a comma separated ``expand`` parameter, ``bets`` implies ``games``."""
+    requested = {part.strip() for part in (expand or "").split(",") if part.strip()}
+    unknown = requested - SUMMARY_EXPANSIONS
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown expand value(s): {', '.join(sorted(unknown))}")
+    if "bets" in requested:
+        requested.add("games")
+    return requested
+
+
+def read_tournament_summaries(db: Session, query, expand: set[str]) -> list[TournamentSummary]:
+    """Tournament metadata with game and participant counts, nested data only as expanded.
+
+    Counts come from two grouped queries over all listed tournaments, so the cost of
+    the summary does not depend on the number of games and bets.
+    """
+    if "games" in expand:
+        games_loader = selectinload(Tournament.games)
+        bets_loader = games_loader.selectinload(Game.bets) if "bets" in expand else games_loader.noload(Game.bets)
+        query = query.options(bets_loader)
+    if "teams" in expand or "games" in expand:
+        # Team emblems are needed to decorate the games as well
+        query = query.options(selectinload(Tournament.teams).selectinload(Team.area))
+    tournaments = query.all()
+    if not tournaments:
+        return []
+    tournament_ids = [tournament.id for tournament in tournaments]
+
+    game_counts = {
+        row.tournament_id: row
+        for row in db.query(
+            Game.tournament_id,
+            func.count(Game.id).label("games"),
+            func.count(Game.id).filter(Game.finished == False, Game.start_time > msk_now()).label("open_games"),
+        )
+        .filter(Game.tournament_id.in_(tournament_ids))
+        .group_by(Game.tournament_id)
+    }
+    participant_counts = dict(
+        db.query(Game.tournament_id, func.count(distinct(Bet.owner_id)))
+        .join(Bet, Bet.game_id == Game.id)
+        .filter(Game.tournament_id.in_(tournament_ids))
+        .group_by(Game.tournament_id)
+        .all()
+    )
+
+    result = []
+    for tournament in tournaments:
+        counts = game_counts.get(tournament.id)
+        summary = TournamentSummary(
+            id=tournament.id,
+            name=tournament.name,
+            logo=tournament.logo,
+            data_id=tournament.data_id,
+            season_id=tournament.season_id,
+            finished=tournament.finished,
+            games_count=counts.games if counts else 0,
+            open_games_count=counts.open_games if counts else 0,
+            participants_count=participant_counts.get(tournament.id, 0),
+        )
+        if "teams" in expand:
+            summary.teams = [TeamReadSimple.model_validate(team) for team in tournament.teams]
+        if "games" in expand:
+            team_emblems = {team.data_id: team.emblem for team in tournament.teams if team.data_id is not None}
+            summary.games = []
+            for game in tournament.games:
+                game_data = GameRead.model_validate(game)
+                game_data.team1_emblem = team_emblems.get(game.team1_id)
+                game_data.team2_emblem = team_emblems.get(game.team2_id)
+                game_data.tournament_name = tournament.name
+                game_data.tournament_logo = tournament.logo
+                for bet_data in game_data.bets:
+                    bet_data.start_time = game.start_time
+                    bet_data.team1 = game.team1
+                    bet_data.team2 = game.team2
+                    bet_data.title = game.title
+                    bet_data.tournament_name = tournament.name
+                    bet_data.tournament_id = tournament.id
+                    bet_data.logo = tournament.logo
+                summary.games.append(game_data)
+        result.append(summary)
+    return result
+
+
+@router.get("/tournaments/summary", response_model=list[TournamentSummary])
+async def get_tournament_summaries(
+    finished: Optional[bool] = Query(None),
+    expand: Optional[str] = Query(None, description="Comma separated: games, bets, teams"),
+    db: Session = Depends(get_db),
+):
+    expand = parse_expand(expand)
+    query = db.query(Tournament)
+    if finished is not None:
+        query = query.filter(Tournament.finished == finished)
+    return read_tournament_summaries(db, query, expand)
+
+
+@router.get("/tournaments/{tournament_id}/summary", response_model=TournamentSummary)
+async def get_tournament_summary(
     tournament_id: int,
+    expand: Optional[str] = Query(None, description="Comma separated: games, bets, teams"),
     db: Session = Depends(get_db),
 ):
+    expand = parse_expand(expand)
+    summaries = read_tournament_summaries(db, db.query(Tournament).filter(Tournament.id == tournament_id), expand)
+    if not summaries:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+    return summaries[0]
 
-    query = db.query(Tournament).filter(Tournament.id == tournament_id).options(
-        joinedload(Tournament.games),
-        joinedload(Tournament.prizes),
-        joinedload(Tournament.teams).joinedload(Team.area)
+
+@router.get(
+    "/tournaments/{tournament_id}",
+    response_model=TournamentRead,
+    dependencies=[Depends(conditional_get(*TOURNAMENT_READ_FAMILIES))],
+)
+async def get_tournament(
+    tournament_id: int,
+    response: Response,
+    db: Session = Depends(get_db),
+):
+    return snapshot_response(
+        ("tournament", tournament_id),
+        TOURNAMENT_READ_FAMILIES,
+        lambda: read_tournament(db, tournament_id).model_dump_json().encode(),
+        response,
     )
 
+
+def read_tournament(db: Session, tournament_id: int) -> TournamentRead:
+    query = db.query(Tournament).filter(Tournament.id == tournament_id).options(*tournament_read_options())
+
     tournament = query.first()
 
     if not tournament:
@@ -293,6 +418,9 @@ async def update_tournament(
     try:
         db_tournament.name = tournament.name
         db_tournament.logo = tournament.logo
+        if tournament.season_id is not None or db_tournament.data_id != tournament.data_id:
+            # Ingestion only imports matches of this season, a competition change invalidates it
+            db_tournament.season_id = tournament.season_id
         db_tournament.data_id = tournament.data_id
         db.commit()
         db.refresh(db_tournament)
@@ -303,43 +431,8 @@ async def update_tournament(
     # Fetch teams associated with the tournament from the external API
     teams_data = await football_api.get_teams(competition_id=db_tournament.data_id)
     if teams_data:
-        for team_data in teams_data.get("teams", []):
-            # Check if the area for the team exists in the database
-            area = db.query(Area).filter(Area.id == team_data["area"]["id"]).first()
-
-            if not area:
-                # If the area doesn't exist, create a new entry
-                area = Area(
-                    id=team_data["area"]["id"],
-                    name=team_data["area"]["name"],
-                    code=team_data["area"]["code"],
-                    flag=team_data["area"]["flag"],
-                )
-                db.add(area)
-                db.commit()  # Commit the new area to the database
-
-            # Check if the team already exists in the database
-            existing_team = db.query(Team).filter(Team.data_id == team_data["id"]).first()
-
-            if existing_team:
-                # If the team already exists, update the details
-                existing_team.name = team_data["name"].rstrip(" FC")
-                existing_team.emblem = team_data["crest"]
-                existing_team.area_id = area.id
-                db_tournament.teams.append(existing_team)
-            else:
-                # If the team does not exist, create a new entry
-                new_team = Team(
-                    data_id=team_data["id"],
-                    name=team_data["name"].rstrip(" FC"),
-                    emblem=team_data["crest"],
-                    area_id=area.id,  # Link the team to the area
-                )
-                db.add(new_team)
-                # Associate the team with the tournament
-                db_tournament.teams.append(new_team)
-
-        db.commit()  # Commit the changes to the database
+        sync_tournament_teams(db, db_tournament.id, teams_data.get("teams", []))
+        db.commit()
 
     return db_tournament
 
@@ -359,59 +452,29 @@ async def finish_tournament(
     if db_tournament.finished:
         raise HTTPException(status_code=400, detail="Tournament is already finished")
 
-    unfinished_games = db.query(Game).filter(Game.tournament_id == tournament_id, Game.finished == False).all()
-    if unfinished_games:
+    has_unfinished_games = db.query(
+        exists().where(Game.tournament_id == tournament_id, Game.finished == False)
+    ).scalar()
+    if has_unfinished_games:
         raise HTTPException(status_code=400, detail="Cannot finish the tournament until all games are finished")
 
     # Remove the tournament from teams' list of tournaments
-    for team in db_tournament.teams:
-        team.tournaments.remove(db_tournament)
-
-    user_points = {}
-
-    for game in db_tournament.games:
-        bets = db.query(Bet).filter(Bet.game_id == game.id).all()
-        for bet in bets:
-            user = bet.owner_id
-            if user not in user_points:
-                user_points[user] = {
-                    "total_points": 0,
-                    "exact_score_count": 0,
-                    "goal_difference_count": 0,
-                    "correct_outcome_count": 0,
-                }
-
-            user_points[user]["total_points"] += bet.points
-
-            if bet.points == 5:
-                user_points[user]["exact_score_count"] += 1
-            elif bet.points == 3:
-                user_points[user]["goal_difference_count"] += 1
-            elif bet.points == 1:
-                user_points[user]["correct_outcome_count"] += 1
-
-    # Rank users based on points and additional criteria
-    ranked_users = sorted(
-        user_points.items(),
-        key=lambda x: (
-            x[1]["total_points"],
-            x[1]["exact_score_count"],
-            x[1]["goal_difference_count"],
-            x[1]["correct_outcome_count"],
-        ),
-        reverse=True,
-    )
-
-    # Here, you can decide to create a record for the top 3 users as "prizes" in your Prize model
-    for rank, (user_id, points_data) in enumerate(ranked_users, start=1):
-        prize = Prize(
-            user_id=user_id,
-            tournament_id=tournament_id,
-            place=rank,
-            points=points_data["total_points"],
-            tournament_name=db_tournament.name,
+    db.execute(delete(tournament_team_association).where(tournament_team_association.c.tournament_id == tournament_id))
+
+    # Every participant gets a prize row with their final place, ranked in the database
+    ranking = ranked_standings_select(tournament_id).subquery()
+    db.execute(
+        insert(Prize).from_select(
+            ["user_id", "tournament_id", "tournament_name", "place", "points"],
+            select(
+                ranking.c.user_id,
+                literal(tournament_id),
+                literal(db_tournament.name),
+                ranking.c.place,
+                ranking.c.total_points,
+            ),
         )
-        db.add(prize)
+    )
 
     db_tournament.finished = True
     db.commit()
@@ -447,18 +510,35 @@ async def get_leaderboard(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    # Players get an empty standing with their first bet, so this lists unsettled bettors too
     leaderboard = (
-        db.query(User.username, func.sum(Bet.points).label("total_points"))
-        .join(Bet, Bet.owner_id == User.id)
-        .join(Game, Game.id == Bet.game_id)
-        .filter(Game.tournament_id == tournament_id)
-        .group_by(User.username)
-        .order_by(desc("total_points"))
+        db.query(User.username, TournamentStanding.total_points)
+        .join(User, User.id == TournamentStanding.user_id)
+        .filter(TournamentStanding.tournament_id == tournament_id)
+        .order_by(
+            TournamentStanding.total_points.desc(),
+            TournamentStanding.exact_score_count.desc(),
+            TournamentStanding.goal_difference_count.desc(),
+            TournamentStanding.correct_outcome_count.desc(),
+        )
         .all()
     )
     return leaderboard
 
 
+@router.get("/tournaments/{tournament_id}/leaderboard/live", response_model=list[LiveUserPoints])
+async def get_live_leaderboard(
+    tournament_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    # Served from memory while games are in play, refreshed once per poll cycle
+    live_table = provisional_standings.get(db, tournament_id)
+    if live_table is None:
+        return await get_leaderboard(tournament_id, db=db, current_user=current_user)
+    return live_table
+
+
 @router.get("/tournaments/{tournament_data_id}/games")
 async def get_competition_games(
         tournament_data_id: int,
@@ -469,14 +549,9 @@ async def get_competition_games(
     if not tournament:
         raise HTTPException(status_code=404, detail="Tournament not found")
 
+    # The upstream match list is cached by the API client
     matches_data = await api.get_matches(tournament_data_id)
+    if not matches_data:
+        raise HTTPException(status_code=502, detail="Could not fetch matches from football-data.org")
 
-    existing_game_ids = db.query(Game.data_id).filter(Game.data_id.isnot(None)).all()
-    existing_game_ids = set(id for (id,) in existing_game_ids)
-
-    filtered_matches = [
-        match for match in matches_data['matches']
-        if match['id'] not in existing_game_ids and match['status'] != 'FINISHED'
-    ]
-
-    return {"matches": filtered_matches}
\ No newline at end of file
+    return {"matches": importable_matches(db, matches_data["matches"])}
\ No newline at end of file
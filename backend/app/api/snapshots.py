@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable
+from fastapi import Response
+from app.db.versions import data_versions
+
+SNAPSHOT_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class SnapshotCache:
+    """Rendered JSON bodies keyed by endpoint and parameters, evicted least recently used first.
+
+    Every entry remembers the data versions it was rendered from and is only served while
+    they are still current, so a write to any family a response depends on invalidates it.
+    The total size of the stored bodies stays under ``max_bytes``.
+    """
+
+    def __init__(self, max_bytes: int = SNAPSHOT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries: OrderedDict[Hashable, tuple[tuple[int, ...], bytes]] = OrderedDict()
+
+    def get(self, key: Hashable, versions: tuple[int, ...]) -> bytes | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] != versions:
+            self.discard(key)
+            return None
+        self.entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: Hashable, versions: tuple[int, ...], body: bytes) -> None:
+        self.discard(key)
+        if len(body) > self.max_bytes:
+            return
+        self.entries[key] = (versions, body)
+        self.size += len(body)
+        while self.size > self.max_bytes:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def discard(self, key: Hashable) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[1])
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.size = 0
+
+
+snapshots = SnapshotCache()
+
+
+def snapshot_response(
+    key: Hashable,
+    families: Iterable[str],
+    render: Callable[[], bytes],
+    response: Response,
+) -> Response:
+    """Serve the cached JSON body of ``key``, rendering and storing it when the data changed.
+
+    Versions are read before rendering, so a write racing with the render leaves the entry
+    outdated rather than serving stale data under a current version. Headers already set on
+    ``response``, such as the ``ETag`` of ``conditional_get``, are carried over.
+
+    Versions are kept per family, not per tournament: any bet outdates the snapshot of every
+    ``/tournaments/{id}`` alongside the ``/tournaments`` lists. This coarse invalidation is
+    deliberate; it matches the ``ETag`` granularity and a miss costs a single render.
+    """
+    versions = tuple(version for version, _ in data_versions.get(families))
+    body = snapshots.get(key, versions)
+    if body is None:
+        body = render()
+        snapshots.put(key, versions, body)
+    return Response(content=body, media_type="application/json", headers=dict(response.headers))
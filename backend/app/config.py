@@ -20,6 +20,8 @@ class MailConfig(BaseModel):
 
 class DataConfig(BaseModel):
     token: SecretStr
+    rate_limit: Optional[int] = 10  # requests per minute allowed by the football-data plan
+    sync_mode: Optional[str] = "competition"  # "competition" batches live scores per league, "match" polls each game
 
 
 class SonnetConfig(BaseModel):
@@ -0,0 +1,12 @@
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def dialect_insert(db: Session):
+    """Return the ``insert`` construct of the session's dialect, which supports ``on_conflict_do_*``.
+
+    Production runs on Postgres and the tests on SQLite; both accept the same upsert API.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
@@ -0,0 +1,130 @@
+"""Per resource family version counters, bumped by every transaction that writes to the family.
+
+Read endpoints derive their ``ETag`` from these counters, so a poll between two writes can be
+answered without running a query. Writes are detected on the session: flushed ORM objects and
+bulk ``insert``/``update``/``delete`` statements executed through it mark their family, and all
+marked families are bumped with one upsert right before the transaction commits.
+"""
+
+import time
+from datetime import datetime
+from itertools import chain
+from typing import Iterable
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+from app.db.database import engine
+from app.db.upsert import dialect_insert
+from app.models.version import DataVersion
+
+TOURNAMENTS = "tournaments"
+GAMES = "games"
+BETS = "bets"
+TEAMS = "teams"
+
+# Table written to -> family whose responses it changes
+TABLE_FAMILIES = {
+    "tournaments": TOURNAMENTS,
+    "prizes": TOURNAMENTS,
+    "tournament_team_association": TOURNAMENTS,
+    "games": GAMES,
+    "bets": BETS,
+    "teams": TEAMS,
+    "areas": TEAMS,
+}
+
+VERSION_TTL = 1.0  # seconds a worker trusts its copy of versions bumped by other workers
+PENDING_KEY = "changed_data_families"
+BUMPED_KEY = "bumped_data_versions"
+
+
+class VersionCache:
+    """Process-local copy of ``data_versions``, reloaded with one query at most every ``ttl`` seconds.
+
+    Commits made in this process invalidate it straight away; writes from other workers are
+    picked up after at most ``ttl`` seconds.
+    """
+
+    def __init__(self, bind, ttl: float = VERSION_TTL):
+        self.bind = bind
+        self.ttl = ttl
+        self.versions: dict[str, tuple[int, datetime]] = {}
+        self.loaded_at: float | None = None
+
+    def get(self, families: Iterable[str]) -> list[tuple[int, datetime | None]]:
+        """``(version, updated_at)`` of each family, ``(0, None)`` for families never written."""
+        if self.loaded_at is None or time.monotonic() - self.loaded_at > self.ttl:
+            self.load()
+        return [self.versions.get(family, (0, None)) for family in families]
+
+    def load(self) -> None:
+        with self.bind.connect() as connection:
+            rows = connection.execute(select(DataVersion.family, DataVersion.version, DataVersion.updated_at)).all()
+        self.versions = {row.family: (row.version, row.updated_at) for row in rows}
+        self.loaded_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        self.loaded_at = None
+
+
+data_versions = VersionCache(engine)
+
+
+def bump_versions(db: Session, families: Iterable[str]) -> None:
+    """Increment the counters of ``families`` in the current transaction with a single upsert."""
+    table = DataVersion.__table__
+    now = datetime.utcnow()
+    # Sorted so concurrent transactions lock the rows in the same order
+    upsert = dialect_insert(db)(table).values(
+        [{"family": family, "version": 1, "updated_at": now} for family in sorted(families)]
+    )
+    db.connection().execute(
+        upsert.on_conflict_do_update(
+            index_elements=[table.c.family],
+            set_={"version": table.c.version + 1, "updated_at": upsert.excluded.updated_at},
+        )
+    )
+
+
+def mark_changed(db: Session, *families: str) -> None:
+    """Schedule a bump of ``families`` when the session commits."""
+    db.info.setdefault(PENDING_KEY, set()).update(families)
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed_changes(session, flush_context):
+    # new/dirty/deleted still describe what was just flushed at this point
+    for instance in chain(session.new, session.dirty, session.deleted):
+        family = TABLE_FAMILIES.get(getattr(instance, "__tablename__", None))
+        if family and (instance not in session.dirty or session.is_modified(instance)):
+            mark_changed(session, family)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_bulk_changes(orm_execute_state):
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    # Covers ORM entities as well as plain tables such as the tournament/team association
+    family = TABLE_FAMILIES.get(orm_execute_state.statement.table.name)
+    if family:
+        mark_changed(orm_execute_state.session, family)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_changed_versions(session):
+    session.flush()  # commit flushes after this hook, pending objects would be missed
+    families = session.info.pop(PENDING_KEY, None)
+    if families:
+        bump_versions(session, families)
+        session.info[BUMPED_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_local_versions(session):
+    if session.info.pop(BUMPED_KEY, False):
+        data_versions.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_families(session):
+    session.info.pop(PENDING_KEY, None)
+    session.info.pop(BUMPED_KEY, None)
@@ -5,11 +5,14 @@ import json
 import logging
 import time
 from ..config import load_config
+from .rate_limit import TokenBucket
 
 app_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 config = load_config(config_file=os.path.join(app_path, "config.yaml"))
 
 API_KEY = config.data.token.get_secret_value()
+RATE_LIMIT = config.data.rate_limit
+SYNC_MODE = config.data.sync_mode
 
 class FootballDataAPI:
     BASE_URL = "https://api.football-data.org/v4"
@@ -26,6 +29,7 @@ class FootballDataAPI:
         self.headers = {"X-Auth-Token": self.api_key}
         self.cache: Dict[str, Dict[str, Any]] = {}
         self.cache_ttl = 600  # 10 minutes
+        self.limiter = TokenBucket(rate=RATE_LIMIT, per=60)
 
     def _get_cache(self, key: str) -> Dict[str, Any] | None:
         if key in self.cache:
@@ -50,6 +54,7 @@ class FootballDataAPI:
         if cached_data:
             return cached_data
 
+        await self.limiter.acquire()
         async with httpx.AsyncClient() as client:
             try:
                 response = await client.get(url, headers=self.headers, params=params)
@@ -66,9 +71,9 @@ class FootballDataAPI:
 
     async def _send_request(self, endpoint: str, params: dict = None):
         url = f"{self.BASE_URL}/{endpoint}"
+        await self.limiter.acquire()
         async with httpx.AsyncClient() as client:
             try:
-                print(self.headers)
                 response = await client.get(url, headers=self.headers, params=params)
                 response.raise_for_status()
                 return response.json()
@@ -96,6 +101,19 @@ class FootballDataAPI:
         """Retrieve the matches for a competition."""
         return await self._send_cached_request(f"competitions/{competition_id}/matches")
 
+    async def get_competition_matches(
+        self, competition_id: int, status: str = None, date_from: str = None, date_to: str = None
+    ):
+        """Retrieve fresh (uncached) matches of a competition filtered by status and date window."""
+        params = {}
+        if status:
+            params["status"] = status
+        if date_from:
+            params["dateFrom"] = date_from
+        if date_to:
+            params["dateTo"] = date_to
+        return await self._send_request(f"competitions/{competition_id}/matches", params=params)
+
     async def get_team_info(self, team_id: int):
         """Retrieve information about a specific team."""
         return await self._send_cached_request(f"teams/{team_id}")
@@ -0,0 +1,28 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async token bucket: allows ``rate`` acquisitions per ``per`` seconds with bursts up to ``capacity``."""
+
+    def __init__(self, rate: int, per: float = 60.0, capacity: int | None = None):
+        self.rate = rate
+        self.per = per
+        self.capacity = capacity or rate
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate / self.per)
+        self.updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait (without blocking the event loop) until a token is available and take it."""
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) * self.per / self.rate)
+                self._refill()
+            self.tokens -= 1
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Boolean, ForeignKey, String, DateTime
+from sqlalchemy import Column, Integer, Boolean, ForeignKey, String, DateTime, Index
 from sqlalchemy.orm import relationship
 from ..db.database import Base
 
@@ -12,7 +12,10 @@ class Bet(Base):
     points = Column(Integer, default=0)
     finished = Column(Boolean, default=False)
     hidden = Column(Boolean, default=False)
-    owner_id = Column(Integer, ForeignKey("users.id"))
+    owner_id = Column(Integer, ForeignKey("users.id"), index=True)
     owner_name = Column(String)
     owner = relationship("User", back_populates="bets")
     game = relationship("Game", back_populates="bets")
+
+    # One bet per player and game, also the conflict target of the bet upsert and the index for game_id lookups
+    __table_args__ = (Index("uq_bets_game_owner", game_id, owner_id, unique=True),)
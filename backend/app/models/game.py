@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from ..db.database import Base
 
@@ -10,7 +10,7 @@ class Game(Base):
     data_id = Column(Integer, unique=True, nullable=True, default=None)
     tournament_id = Column(Integer, ForeignKey("tournaments.id"), nullable=False)
     title = Column(String)
-    start_time = Column(DateTime, nullable=False)
+    start_time = Column(DateTime, nullable=False, index=True)
     team1 = Column(String, nullable=False)
     team1_id = Column(Integer, ForeignKey("teams.data_id"), unique=False, nullable=True)
     team2 = Column(String, nullable=False)
@@ -18,8 +18,12 @@ class Game(Base):
     finished = Column(Boolean, default=False)
     team1_score = Column(Integer, default=0)
     team2_score = Column(Integer, default=0)
+    settlement_version = Column(Integer, nullable=False, default=0, server_default="0")  # bumped on every settlement
 
     tournament = relationship("Tournament", back_populates="games")
     bets = relationship("Bet", back_populates="game")
     team1_info = relationship("Team", foreign_keys=[team1_id], primaryjoin="Game.team1_id == Team.data_id")
     team2_info = relationship("Team", foreign_keys=[team2_id], primaryjoin="Game.team2_id == Team.data_id")
+
+    # Also serves lookups on tournament_id alone
+    __table_args__ = (Index("ix_games_tournament_finished", tournament_id, finished),)
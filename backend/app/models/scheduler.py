@@ -0,0 +1,10 @@
+from sqlalchemy import Column, String, DateTime
+from ..db.database import Base
+
+
+class SchedulerLease(Base):
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String, primary_key=True)
+    holder = Column(String, nullable=False)  # host:pid of the process running the periodic jobs
+    expires_at = Column(DateTime, nullable=False)  # UTC, renewed by the holder on every election round
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, ForeignKey, Index
+from ..db.database import Base
+
+
+class TournamentStanding(Base):
+    __tablename__ = "tournament_standings"
+
+    tournament_id = Column(Integer, ForeignKey("tournaments.id"), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    total_points = Column(Integer, nullable=False, default=0)
+    exact_score_count = Column(Integer, nullable=False, default=0)
+    goal_difference_count = Column(Integer, nullable=False, default=0)
+    correct_outcome_count = Column(Integer, nullable=False, default=0)
+
+    # Leaderboard order: points first, then the tiebreakers used when a tournament is finished
+    __table_args__ = (
+        Index(
+            "ix_tournament_standings_ranking",
+            tournament_id,
+            total_points.desc(),
+            exact_score_count.desc(),
+            goal_difference_count.desc(),
+            correct_outcome_count.desc(),
+        ),
+    )
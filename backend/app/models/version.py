@@ -0,0 +1,10 @@
+from sqlalchemy import Column, String, Integer, DateTime
+from ..db.database import Base
+
+
+class DataVersion(Base):
+    __tablename__ = "data_versions"
+
+    family = Column(String, primary_key=True)  # resource family, e.g. "games" or "bets"
+    version = Column(Integer, nullable=False, default=0)  # bumped by every transaction writing to the family
+    updated_at = Column(DateTime, nullable=False)  # UTC time of the last bump
@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import time
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, joinedload
+from app.db.database import SessionLocal
+from app.models.game import Game
+from app.models.tournament import Tournament
+from app.football_data.api import FootballDataAPI
+from app.api.crud.game import game_from_match, importable_matches
+from app.api.crud.team import sync_tournament_teams
+from app.notifications.send import send_notifications
+from app.ai_bots.sonnet.sonnet_ai_bot import SonnetAIBot
+
+SCHEDULED_STATUSES = ["SCHEDULED", "TIMED"]
+
+
+def new_games_for_tournament(db: Session, tournament: Tournament, matches: list[dict]) -> tuple[list[dict], list[dict]]:
+    """Game rows and team payloads for the upcoming matches of a competition not imported yet.
+
+    Matches of another season of the competition are skipped, as are matches whose teams are not
+    decided yet, e.g. later knockout rounds, which are left for a later run.
+    """
+    upcoming = [
+        match
+        for match in matches
+        if match["status"] in SCHEDULED_STATUSES
+        and (match.get("season") or {}).get("id") == tournament.season_id
+        and match["homeTeam"]["id"]
+        and match["awayTeam"]["id"]
+    ]
+    new_matches = importable_matches(db, upcoming)
+    teams = {team["id"]: team for match in new_matches for team in (match["homeTeam"], match["awayTeam"])}
+    return [game_from_match(match, tournament.id) for match in new_matches], list(teams.values())
+
+
+async def current_season_id(football_api: FootballDataAPI, tournament: Tournament) -> int | None:
+    """Id of the competition's current season, for tournaments stored without one."""
+    competition = await football_api.get_competition(tournament.data_id)
+    season_id = ((competition or {}).get("currentSeason") or {}).get("id")
+    if season_id is None:
+        logging.warning(
+            f"Ingestion: tournament {tournament.id} skipped, competition {tournament.data_id} has no season"
+        )
+    else:
+        logging.warning(f"Ingestion: tournament {tournament.id} has no season, using current season {season_id}")
+    return season_id
+
+
+async def ingest_matches(db: Session, football_api: FootballDataAPI) -> tuple[list[Game], dict]:
+    """Import the upcoming matches of every open tournament that tracks a competition.
+
+    Each competition is pulled once, through the cached match list, and the new games of all
+    tournaments are inserted with their missing teams and links in a single transaction.
+    Tournaments stored without a season adopt the competition's current one.
+    Returns the new games, with their tournament loaded, and a report.
+    """
+    started = time.perf_counter()
+    tournaments = (
+        db.query(Tournament)
+        .filter(Tournament.finished == False, Tournament.data_id.isnot(None))
+        .order_by(Tournament.id)
+        .all()
+    )
+    results = await asyncio.gather(*(football_api.get_matches(tournament.data_id) for tournament in tournaments))
+
+    rows = []
+    for tournament, matches_data in zip(tournaments, results):
+        if not matches_data:
+            logging.warning(f"Ingestion: no match list for competition {tournament.data_id}")
+            continue
+        if tournament.season_id is None:
+            # The competition lookup failed when the tournament was created, adopt the current season
+            tournament.season_id = await current_season_id(football_api, tournament)
+            if tournament.season_id is None:
+                continue
+        game_rows, teams = new_games_for_tournament(db, tournament, matches_data.get("matches", []))
+        # games.data_id is unique, two open tournaments tracking one competition share its matches
+        imported = {row["data_id"] for row in rows}
+        game_rows = [row for row in game_rows if row["data_id"] not in imported]
+        if teams:
+            sync_tournament_teams(db, tournament.id, teams)
+        rows.extend(game_rows)
+
+    game_ids = list(db.scalars(insert(Game).returning(Game.id), rows)) if rows else []
+    db.commit()
+    games = (
+        db.query(Game)
+        .options(joinedload(Game.tournament))
+        .filter(Game.id.in_(game_ids))
+        .order_by(Game.start_time, Game.id)
+        .all()
+        if game_ids
+        else []
+    )
+
+    report = {
+        "tournaments": len(tournaments),
+        "games": len(games),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+    logging.info(f"Ingested matches: {report}")
+    return games, report
+
+
+def predict_game(game_id: int) -> None:
+    """Blocking AI prediction for one game, with its own session; meant for a worker thread."""
+    db = SessionLocal()
+    try:
+        SonnetAIBot().make_prediction(db, game_id)
+    except Exception as error:
+        logging.error(f"AI prediction failed for game {game_id}: {error}")
+    finally:
+        db.close()
+
+
+async def announce_games(db: Session, games: list[Game]) -> None:
+    """Notify about freshly imported games, then generate their AI predictions off the event loop."""
+    if not games:
+        return
+    try:
+        await send_notifications([(game, game.tournament.name) for game in games], [], db)
+    except Exception as error:
+        logging.error(f"Notifications for ingested games failed: {error}")
+    for game in games:
+        await asyncio.to_thread(predict_game, game.id)
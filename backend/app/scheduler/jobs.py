@@ -0,0 +1,145 @@
+from datetime import datetime
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.date import DateTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy.orm import Session
+from app.api import MSK
+from app.db.database import SessionLocal, engine
+from app.db.versions import GAMES, data_versions
+from app.football_data.api import get_football_data_api
+from app.scheduler.ingest import announce_games, ingest_matches
+from app.scheduler.leader import LeaderElection
+from app.scheduler.poller import poll_game_statuses
+from app.scheduler.schedule import LIVE_INTERVAL, msk_now, next_poll_time
+
+GAME_STATUSES_JOB_ID = "update_game_statuses"
+INGEST_JOB_ID = "ingest_matches"
+INGEST_INTERVAL = 6  # hours between two imports of upcoming matches
+ELECTION_JOB_ID = "leader_election"
+ELECTION_INTERVAL = 15  # seconds, a third of the lease TTL
+
+scheduler = AsyncIOScheduler()
+leader = LeaderElection(engine)
+planned_games_version = None  # games data version the leader last planned the poller for
+
+
+def start_scheduler() -> None:
+    """Start the scheduler in this process; periodic jobs only run once it wins the election."""
+    scheduler.start()
+    scheduler.add_job(
+        run_leader_election,
+        IntervalTrigger(seconds=ELECTION_INTERVAL),
+        id=ELECTION_JOB_ID,
+        next_run_time=datetime.now(tz=MSK),
+        max_instances=1,
+        coalesce=True,
+    )
+
+
+def stop_scheduler() -> None:
+    scheduler.shutdown()
+    leader.release()
+
+
+async def run_leader_election():
+    was_leader = leader.is_leader
+    is_leader = leader.try_acquire()
+    if is_leader and not was_leader:
+        print(f"LEADER ELECTED: {leader.identity}")
+        start_leader_jobs()
+    elif was_leader and not is_leader:
+        print(f"LEADERSHIP LOST: {leader.identity}")
+        stop_leader_jobs()
+    if is_leader:
+        replan_after_game_changes()
+
+
+def start_leader_jobs() -> None:
+    schedule_game_statuses(msk_now())
+    scheduler.add_job(
+        ingest_new_matches,
+        IntervalTrigger(hours=INGEST_INTERVAL),
+        id=INGEST_JOB_ID,
+        next_run_time=datetime.now(tz=MSK),
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+
+
+def stop_leader_jobs() -> None:
+    for job_id in (GAME_STATUSES_JOB_ID, INGEST_JOB_ID):
+        if scheduler.get_job(job_id):
+            scheduler.remove_job(job_id)
+
+
+# Game status updater function
+async def update_game_statuses():
+    print("PERIODIC TASK")
+    db = SessionLocal()
+    next_run = msk_now() + LIVE_INTERVAL  # retry soon if the sweep fails
+    try:
+        football_api = await get_football_data_api()
+        await poll_game_statuses(db, football_api)
+        next_run = next_poll_time(db)
+    finally:
+        db.close()
+        if leader.is_leader:
+            schedule_game_statuses(next_run)
+
+
+async def ingest_new_matches():
+    print("INGEST TASK")
+    db = SessionLocal()
+    try:
+        football_api = await get_football_data_api()
+        games, _ = await ingest_matches(db, football_api)
+        if games:
+            wake_game_statuses(db)
+            await announce_games(db, games)
+    finally:
+        db.close()
+
+
+def schedule_game_statuses(run_date: datetime) -> None:
+    """Run the status poller once at ``run_date`` (naive MSK); the run plans the next one itself."""
+    scheduler.add_job(
+        update_game_statuses,
+        DateTrigger(run_date=run_date.replace(tzinfo=MSK)),
+        id=GAME_STATUSES_JOB_ID,
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+
+
+def wake_game_statuses(db: Session) -> None:
+    """Re-plan the poller after games were added, moved or removed.
+
+    Only the leader runs the poller; it picks up changes made on other processes in its
+    next election round.
+    """
+    if leader.is_leader:
+        schedule_game_statuses(next_poll_time(db))
+
+
+def replan_after_game_changes() -> None:
+    """Bring the poller forward when games changed on any worker since the last election round.
+
+    Every game write bumps the ``games`` data version, so games created, moved or removed on
+    other workers reach the leader within one election interval instead of its ``MAX_SLEEP``.
+    A planned run is only ever moved earlier, so the poller's own writes cannot postpone it.
+    """
+    global planned_games_version
+    [version] = data_versions.get([GAMES])
+    if version == planned_games_version:
+        return
+    planned_games_version = version
+    db = SessionLocal()
+    try:
+        run_date = next_poll_time(db)
+    finally:
+        db.close()
+    planned = scheduler.get_job(GAME_STATUSES_JOB_ID)
+    if planned is None or planned.next_run_time is None or run_date.replace(tzinfo=MSK) < planned.next_run_time:
+        schedule_game_statuses(run_date)
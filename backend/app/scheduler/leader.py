@@ -0,0 +1,107 @@
+import logging
+import os
+import socket
+from datetime import datetime, timedelta
+from sqlalchemy import text, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+from app.models.scheduler import SchedulerLease
+
+ADVISORY_LOCK_KEY = 7_254_031  # arbitrary, shared by every worker of the app
+LEASE_NAME = "periodic_jobs"
+LEASE_TTL = timedelta(seconds=45)
+
+
+class LeaderElection:
+    """Elects a single process to run the periodic jobs.
+
+    On Postgres the leader holds a session-level advisory lock on a dedicated
+    connection, so the lock is released as soon as the process or its connection dies.
+    Other databases (SQLite in tests) use a lease row that the leader renews on every
+    round and that anyone may take over once it expired.
+    """
+
+    def __init__(self, engine: Engine, key: int = ADVISORY_LOCK_KEY, lease_ttl: timedelta = LEASE_TTL):
+        self.engine = engine
+        self.key = key
+        self.lease_ttl = lease_ttl
+        self.identity = f"{socket.gethostname()}:{os.getpid()}"
+        self.is_leader = False
+        self._connection: Connection | None = None
+
+    def try_acquire(self) -> bool:
+        """Run one election round and return whether this process is the leader."""
+        try:
+            if self.engine.dialect.name == "postgresql":
+                self.is_leader = self._try_advisory_lock()
+            else:
+                self.is_leader = self._try_lease()
+        except SQLAlchemyError as err:
+            logging.error(f"Leader election failed: {err}")
+            self._drop_connection()
+            self.is_leader = False
+        return self.is_leader
+
+    def release(self) -> None:
+        try:
+            if self._connection is not None:
+                self._connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.key})
+            elif self.is_leader:
+                with Session(self.engine) as db:
+                    db.query(SchedulerLease).filter(
+                        SchedulerLease.name == LEASE_NAME, SchedulerLease.holder == self.identity
+                    ).delete()
+                    db.commit()
+        except SQLAlchemyError as err:
+            logging.error(f"Failed to release leadership: {err}")
+        finally:
+            self._drop_connection()
+            self.is_leader = False
+
+    def _try_advisory_lock(self) -> bool:
+        if self._connection is not None:
+            # Still leader as long as the session holding the lock is alive
+            self._connection.execute(text("SELECT 1"))
+            self._connection.commit()
+            return True
+        connection = self.engine.connect()
+        locked = connection.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": self.key}).scalar()
+        connection.commit()
+        if locked:
+            self._connection = connection
+        else:
+            connection.close()
+        return bool(locked)
+
+    def _try_lease(self) -> bool:
+        now = datetime.utcnow()
+        with Session(self.engine) as db:
+            renewed = db.execute(
+                update(SchedulerLease)
+                .where(
+                    SchedulerLease.name == LEASE_NAME,
+                    (SchedulerLease.holder == self.identity) | (SchedulerLease.expires_at < now),
+                )
+                .values(holder=self.identity, expires_at=now + self.lease_ttl)
+            ).rowcount
+            if renewed:
+                db.commit()
+                return True
+            try:
+                db.add(SchedulerLease(name=LEASE_NAME, holder=self.identity, expires_at=now + self.lease_ttl))
+                db.commit()
+                return True
+            except IntegrityError:
+                db.rollback()
+                return False
+
+    def _drop_connection(self) -> None:
+        if self._connection is not None:
+            try:
+                # Closing would return the session to the pool with the advisory lock still held;
+                # invalidating closes the database session itself, which releases the lock
+                self._connection.invalidate()
+            except SQLAlchemyError:
+                pass
+            self._connection = None
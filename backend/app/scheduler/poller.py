@@ -0,0 +1,113 @@
+import asyncio
+import logging
+import time
+from datetime import timedelta
+from sqlalchemy.orm import Session, contains_eager
+from app.models.game import Game
+from app.models.tournament import Tournament
+from app.football_data.api import FootballDataAPI, SYNC_MODE
+from app.utils.bet_utils import settle_games
+from app.utils.live_standings import provisional_standings
+from app.scheduler.schedule import msk_now
+
+LIVE_STATUSES = ["IN_PLAY", "PAUSED", "FINISHED"]
+
+
+def apply_match_data(game: Game, game_data: dict | None) -> str | None:
+    """Copy the upstream score of a match onto its game and return the match status."""
+    if not game_data:
+        return None
+    status = game_data["status"]
+    if status in LIVE_STATUSES:
+        game.team1_score = game_data["score"]["fullTime"]["home"]
+        game.team2_score = game_data["score"]["fullTime"]["away"]
+    elif status == "POSTPONED":
+        # Handle postponed games
+        # game.start_time = datetime.strptime(game_data['utcDate'], "%Y-%m-%dT%H:%M:%SZ") + timedelta(hours=3)
+        pass
+    return status
+
+
+async def fetch_competition_matches(football_api: FootballDataAPI, competition_id: int, games: list[Game]):
+    """Pull every match of a competition around the kickoffs of ``games`` with a single request."""
+    kickoffs = [game.start_time - timedelta(hours=3) for game in games]
+    matches_data = await football_api.get_competition_matches(
+        competition_id,
+        date_from=min(kickoffs).strftime("%Y-%m-%d"),
+        date_to=(max(kickoffs) + timedelta(days=1)).strftime("%Y-%m-%d"),
+    )
+    if matches_data is None:
+        return None
+    return {match["id"]: match for match in matches_data.get("matches", [])}
+
+
+async def fetch_matches_by_competition(football_api: FootballDataAPI, games: list[Game]) -> list[dict | None]:
+    """Fetch match data for ``games`` with one upstream call per competition.
+
+    Games of tournaments without a ``data_id``, or whose competition request failed,
+    fall back to one request per match.
+    """
+    groups: dict[int, list[Game]] = {}
+    for game in games:
+        if game.tournament.data_id is not None:
+            groups.setdefault(game.tournament.data_id, []).append(game)
+
+    competitions = list(groups)
+    batches = await asyncio.gather(
+        *(fetch_competition_matches(football_api, competition, groups[competition]) for competition in competitions)
+    )
+    matches = {}
+    for competition_id, batch in zip(competitions, batches):
+        if batch is not None:
+            matches[competition_id] = batch
+
+    fallback = [game for game in games if game.tournament.data_id not in matches]
+    fallback_results = await asyncio.gather(*(football_api.get_match(game.data_id) for game in fallback))
+    fallback_matches = {game.id: game_data for game, game_data in zip(fallback, fallback_results)}
+
+    return [
+        fallback_matches[game.id] if game.id in fallback_matches else matches[game.tournament.data_id].get(game.data_id)
+        for game in games
+    ]
+
+
+async def poll_game_statuses(db: Session, football_api: FootballDataAPI, mode: str = SYNC_MODE) -> dict:
+    """Fetch all kicked-off unfinished games concurrently and apply their scores in one commit.
+
+    In ``competition`` mode the games are grouped by tournament and each competition is
+    pulled with a single request; ``match`` mode requests every game separately. Upstream
+    calls are throttled by the API token bucket, so the sweep waits on the event loop
+    instead of blocking it. Games reported as finished are settled together.
+    """
+    started = time.perf_counter()
+    games = (
+        db.query(Game)
+        .join(Tournament, Game.tournament_id == Tournament.id)
+        .options(contains_eager(Game.tournament))
+        .filter(Game.finished == False, Game.data_id.isnot(None), Game.start_time <= msk_now())
+        .all()
+    )
+
+    if mode == "competition":
+        results = await fetch_matches_by_competition(football_api, games)
+    else:
+        results = await asyncio.gather(*(football_api.get_match(game.data_id) for game in games))
+    fetched_at = time.perf_counter()
+
+    statuses = [apply_match_data(game, game_data) for game, game_data in zip(games, results)]
+    settled = settle_games(db, [game.id for game, status in zip(games, statuses) if status == "FINISHED"])
+    db.commit()
+    provisional_standings.refresh(db)
+
+    report = {
+        "mode": mode,
+        "games": len(games),
+        "fetched": sum(1 for game_data in results if game_data),
+        "live": statuses.count("IN_PLAY") + statuses.count("PAUSED"),
+        "finished": statuses.count("FINISHED"),
+        "settled": len(settled),
+        "fetch_seconds": round(fetched_at - started, 3),
+        "total_seconds": round(time.perf_counter() - started, 3),
+    }
+    logging.info(f"Game status sweep: {report}")
+    return report
@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.api import MSK
+from app.models.game import Game
+
+LIVE_WINDOW = timedelta(hours=2, minutes=30)  # kickoff to final whistle, with stoppage time and breaks
+LIVE_INTERVAL = timedelta(minutes=1)
+OVERDUE_INTERVAL = timedelta(minutes=30)  # games past the live window that upstream has not finished yet
+KICKOFF_LEAD = timedelta(minutes=1)
+MAX_SLEEP = timedelta(hours=1)  # safety net for games added by another process
+
+
+def msk_now() -> datetime:
+    """Current time as a naive MSK datetime, the way ``Game.start_time`` is stored."""
+    return datetime.now(tz=MSK).replace(tzinfo=None)
+
+
+def plan_next_poll(
+    now: datetime,
+    latest_started: datetime | None,
+    earliest_started: datetime | None,
+    next_kickoff: datetime | None,
+) -> datetime:
+    """Decide when the status poller should run next.
+
+    Poll every ``LIVE_INTERVAL`` while a game is inside its live window, otherwise wake
+    up just before the next kickoff. Games stuck past their live window are rechecked
+    every ``OVERDUE_INTERVAL`` and the poller never sleeps longer than ``MAX_SLEEP``.
+    """
+    if latest_started is not None and latest_started >= now - LIVE_WINDOW:
+        return now + LIVE_INTERVAL
+
+    candidates = [now + MAX_SLEEP]
+    if next_kickoff is not None:
+        candidates.append(max(next_kickoff - KICKOFF_LEAD, now))
+    if earliest_started is not None:
+        candidates.append(now + OVERDUE_INTERVAL)
+    return min(candidates)
+
+
+def next_poll_time(db: Session, now: datetime | None = None) -> datetime:
+    now = now or msk_now()
+    latest_started, earliest_started, next_kickoff = (
+        db.query(
+            func.max(Game.start_time).filter(Game.start_time <= now),
+            func.min(Game.start_time).filter(Game.start_time <= now),
+            func.min(Game.start_time).filter(Game.start_time > now),
+        )
+        .filter(Game.finished == False, Game.data_id.isnot(None))
+        .one()
+    )
+    return plan_next_poll(now, latest_started, earliest_started, next_kickoff)
@@ -28,6 +28,20 @@ class TournamentRead(TournamentBase):
         # orm_mode = True
 
 
+class TournamentSummary(TournamentBase):
+    id: int
+    finished: bool
+    games_count: int = 0
+    open_games_count: int = 0
+    participants_count: int = 0
+    # Only filled in when requested with ``expand``
+    games: Optional[list["GameRead"]] = None
+    teams: Optional[list["TeamReadSimple"]] = None
+
+    class Config:
+        from_attributes = True
+
+
 from .game import GameRead
 from .prize import PrizeRead
 from .team import TeamReadSimple
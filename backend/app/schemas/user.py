@@ -55,5 +55,9 @@ class UserPoints(BaseModel):
         from_attributes = True
 
 
+class LiveUserPoints(UserPoints):
+    live_points: int = 0  # part of total_points coming from games still in play
+
+
 from .bet import BetRead
 from .prize import PrizeRead
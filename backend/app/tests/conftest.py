@@ -1,13 +1,26 @@
 # In conftest.py or your test file
 
+from datetime import datetime
+from itertools import repeat
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import Mock, MagicMock
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import StaticPool
+from ..db import versions as versions_module
+from ..db.database import Base
+from ..models.bet import Bet
+from ..models.game import Game
+from ..models.team import Team
 from ..models.tournament import Tournament
 from ..models.user import User
+from ..models import admin, area, bet, game, prize, scheduler, standing, team, version  # noqa: F401 - all tables
 from ..schemas.tournament import TournamentCreate, TournamentRead
+from ..utils import open_games as open_games_module
 
 
 @pytest.fixture
@@ -57,3 +70,88 @@ def tournament_mocker():
         "set_existing_tournament": set_existing_tournament,
         "simulate_db_error": simulate_db_error,
     }
+
+
+@pytest.fixture
+def sqlite_db():
+    # In-memory database with the full schema, shared by every connection of the session
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield db
+    finally:
+        db.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def seed_tournament(sqlite_db):
+    """Factory seeding a tournament with its two teams, players, games and bets.
+
+    Every game is ``teams[0]`` against ``teams[1]``; ``kickoff`` is one start time for all ``games`` or a
+    list with one per game, other keywords are game fields. ``bets`` maps a username to the bet fields
+    placed on every game, or to a list with the fields of one bet per game. Players are created on first
+    use, so several tournaments can share them.
+    """
+
+    def slug(name):
+        return name.lower().replace(" ", "")
+
+    def seed(
+        name="League",
+        teams=("Home", "Away"),
+        team_ids=(1, 2),
+        team_area=None,
+        users=("player",),
+        games=1,
+        kickoff=datetime(2026, 5, 1, 18, 0),
+        bets=None,
+        **game_fields,
+    ):
+        tournament = Tournament(name=name, logo=f"{slug(name)}.png")
+        tournament.teams = [
+            Team(name=team_name, emblem=f"{slug(team_name)}.png", data_id=data_id, area=team_area)
+            for team_name, data_id in zip(teams, team_ids)
+        ]
+        players = [
+            sqlite_db.query(User).filter(User.username == username).first()
+            or User(username=username, email=f"{username}@example.com")
+            for username in users
+        ]
+        sqlite_db.add_all([tournament, *players])
+        sqlite_db.flush()
+        kickoffs = kickoff if isinstance(kickoff, list) else [kickoff] * games
+        fixtures = [
+            Game(
+                tournament_id=tournament.id,
+                team1=teams[0],
+                team2=teams[1],
+                team1_id=team_ids[0],
+                team2_id=team_ids[1],
+                start_time=start_time,
+                **game_fields,
+            )
+            for start_time in kickoffs
+        ]
+        sqlite_db.add_all(fixtures)
+        sqlite_db.flush()
+        for player in players:
+            placed = (bets or {}).get(player.username, [])
+            for fixture, fields in zip(fixtures, placed if isinstance(placed, list) else repeat(placed)):
+                sqlite_db.add(Bet(game_id=fixture.id, owner_id=player.id, owner_name=player.username, **fields))
+        sqlite_db.commit()
+        return SimpleNamespace(tournament=tournament, users=players, games=fixtures)
+
+    return seed
+
+
+@pytest.fixture
+def open_games_cache(sqlite_db, monkeypatch):
+    # Empty open games cache reading the data versions of the test database
+    data_versions = versions_module.VersionCache(sqlite_db.get_bind())
+    monkeypatch.setattr(versions_module, "data_versions", data_versions)
+    monkeypatch.setattr(open_games_module, "data_versions", data_versions)
+    monkeypatch.setattr(open_games_module.open_games, "games", {})
+    monkeypatch.setattr(open_games_module.open_games, "versions", None)
+    return open_games_module.open_games
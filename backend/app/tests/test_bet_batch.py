@@ -0,0 +1,116 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app.ai_bots.sonnet.sonnet_ai_bot import SonnetAIBot
+from app.api.routers.bet import create_bet, create_bets
+from app.models.bet import Bet
+from app.models.game import Game
+from app.schemas.bet import BetCreate
+
+# A day after the three hour betting cutoff
+KICKOFF = datetime.utcnow() + timedelta(days=1, hours=3)
+
+
+def matchday(seeded):
+    return seeded.users[0], [game.id for game in seeded.games]
+
+
+@pytest.mark.asyncio
+async def test_batch_creates_and_updates_bets_with_a_fixed_number_of_statements(
+    sqlite_db, open_games_cache, seed_tournament
+):
+    user, game_ids = matchday(seed_tournament(games=10, kickoff=KICKOFF))
+    sqlite_db.add(Bet(game_id=game_ids[0], owner_id=user.id, owner_name="player", team1_score=0, team2_score=0))
+    sqlite_db.commit()
+    sqlite_db.refresh(user)
+    statements = []
+    event.listen(sqlite_db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    bets = await create_bets(
+        [BetCreate(game_id=game_id, team1_score=2, team2_score=1) for game_id in game_ids],
+        db=sqlite_db,
+        current_user=user,
+    )
+
+    # data versions, open games load, upsert, empty standings, version bump
+    assert len(statements) == 5
+    assert sorted(bet.game_id for bet in bets) == game_ids
+    assert {(bet.team1_score, bet.team2_score) for bet in bets} == {(2, 1)}
+    assert bets[0].team1_emblem == "home.png" and bets[0].team2_emblem == "away.png"
+    assert bets[0].tournament_name == "League" and bets[0].tournament_logo == "league.png"
+    assert sqlite_db.query(Bet).count() == 10
+
+    sqlite_db.refresh(user)
+    statements.clear()
+    await create_bets([BetCreate(game_id=game_ids[0], team1_score=0, team2_score=0)], db=sqlite_db, current_user=user)
+
+    # Kickoffs and details now come from memory: data versions, upsert, empty standings, version bump
+    assert len(statements) == 4
+
+
+@pytest.mark.asyncio
+async def test_a_started_game_rejects_the_whole_batch(sqlite_db, open_games_cache, seed_tournament):
+    user, game_ids = matchday(seed_tournament(games=2, kickoff=KICKOFF))
+    started = sqlite_db.get(Game, game_ids[1])
+    started.start_time = datetime.utcnow()
+    sqlite_db.commit()
+
+    with pytest.raises(HTTPException) as error:
+        await create_bets(
+            [BetCreate(game_id=game_id, team1_score=1, team2_score=1) for game_id in game_ids],
+            db=sqlite_db,
+            current_user=user,
+        )
+
+    assert error.value.status_code == 400
+    assert str(game_ids[1]) in error.value.detail
+    assert sqlite_db.query(Bet).count() == 0
+
+
+@pytest.mark.asyncio
+async def test_resubmitting_a_bet_overwrites_the_prediction(sqlite_db, open_games_cache, seed_tournament):
+    user, [game_id] = matchday(seed_tournament(games=1, kickoff=KICKOFF))
+
+    first = await create_bet(BetCreate(game_id=game_id, team1_score=1, team2_score=0), db=sqlite_db, current_user=user)
+    second = await create_bet(BetCreate(game_id=game_id, team1_score=3, team2_score=3), db=sqlite_db, current_user=user)
+
+    assert second.id == first.id
+    assert (second.team1_score, second.team2_score) == (3, 3)
+    assert second.team1_emblem == "home.png"
+    assert sqlite_db.query(Bet).count() == 1
+
+
+@pytest.mark.asyncio
+async def test_open_games_cache_follows_game_changes(sqlite_db, open_games_cache, seed_tournament):
+    user, [game_id] = matchday(seed_tournament(games=1, kickoff=KICKOFF))
+    assert open_games_cache.get(sqlite_db, game_id).team1 == "Home"
+
+    sqlite_db.get(Game, game_id).team1 = "Renamed"
+    sqlite_db.commit()
+    new_game = Game(tournament_id=1, team1="C", team2="D", start_time=datetime(2099, 1, 1))
+    sqlite_db.add(new_game)
+    sqlite_db.commit()
+
+    assert open_games_cache.get(sqlite_db, game_id).team1 == "Renamed"
+    assert new_game.id in open_games_cache.games
+    assert open_games_cache.get(sqlite_db, 999) is None
+
+
+def test_predicting_a_game_again_replaces_the_bot_bet(sqlite_db, seed_tournament, monkeypatch):
+    _, [game_id] = matchday(seed_tournament(games=1, kickoff=KICKOFF))
+    bot = SonnetAIBot.__new__(SonnetAIBot)  # no API client needed with a canned prediction
+    predictions = iter([(1, 0), (2, 2)])
+
+    def predict(game_info):
+        home_score, away_score = next(predictions)
+        return {"home_score": home_score, "away_score": away_score, "explanation": "{}"}
+
+    monkeypatch.setattr(bot, "generate_prediction", predict)
+    bot.make_prediction(sqlite_db, game_id)
+    bet, _ = bot.make_prediction(sqlite_db, game_id)
+
+    assert (bet.team1_score, bet.team2_score) == (2, 2)
+    assert sqlite_db.query(Bet).filter(Bet.game_id == game_id).count() == 1
@@ -0,0 +1,64 @@
+import pytest
+from fastapi import Response
+
+from app.api.routers import bet as bet_router
+from app.api.routers.bet import NEXT_CURSOR_HEADER, get_bets
+
+PLAYERS = ("user0", "user1", "user2")
+# Every player has bet on each of the four games
+HISTORY = dict(
+    teams=("Team 1", "Team 2"),
+    users=PLAYERS,
+    games=4,
+    bets={user: dict(team1_score=1, team2_score=0) for user in PLAYERS},
+)
+
+
+@pytest.mark.asyncio
+async def test_pages_follow_the_cursor_until_the_last_bet(sqlite_db, seed_tournament):
+    tournament_id = seed_tournament(**HISTORY).tournament.id
+    pages, after_id = [], None
+    while True:
+        response = Response()
+        page = await get_bets(
+            response, user_id=None, game_id=None, tournament_id=tournament_id, after_id=after_id, limit=5, db=sqlite_db
+        )
+        pages.append(page)
+        after_id = response.headers.get(NEXT_CURSOR_HEADER)
+        if after_id is None:
+            break
+        after_id = int(after_id)
+
+    ids = [bet.id for page in pages for bet in page]
+    assert [len(page) for page in pages] == [5, 5, 2]
+    assert ids == sorted(ids) and len(set(ids)) == 12
+    assert {(bet.team1_emblem, bet.team2_emblem) for page in pages for bet in page} == {("team1.png", "team2.png")}
+    assert pages[0][0].tournament_id == tournament_id and pages[0][0].logo == "league.png"
+
+
+@pytest.mark.asyncio
+async def test_filters_combine_with_the_cursor(sqlite_db, seed_tournament):
+    user_ids = [user.id for user in seed_tournament(**HISTORY).users]
+    response = Response()
+
+    page = await get_bets(
+        response, user_id=user_ids[1], game_id=None, tournament_id=None, after_id=None, limit=100, db=sqlite_db
+    )
+
+    assert len(page) == 4
+    assert {bet.owner_id for bet in page} == {user_ids[1]}
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_without_paging_parameters_every_bet_is_returned(sqlite_db, seed_tournament, monkeypatch):
+    monkeypatch.setattr(bet_router, "BETS_PAGE_SIZE", 5)
+    seed_tournament(**HISTORY)
+    response = Response()
+
+    bets = await get_bets(
+        response, user_id=None, game_id=None, tournament_id=None, after_id=None, limit=None, db=sqlite_db
+    )
+
+    assert len(bets) == 12
+    assert NEXT_CURSOR_HEADER not in response.headers
@@ -0,0 +1,98 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.api.routers import export
+from app.api.routers.export import export_bets, export_games, export_standings
+from app.models.bet import Bet
+from app.models.game import Game
+from app.models.tournament import Tournament
+from app.models.user import User
+
+
+@pytest.fixture
+def export_db(sqlite_db, monkeypatch):
+    monkeypatch.setattr(export, "SessionLocal", sessionmaker(bind=sqlite_db.get_bind()))
+    monkeypatch.setattr(export, "EXPORT_BATCH_SIZE", 2)
+    tournament = Tournament(name="League")
+    users = [User(username=name, email=f"{name}@example.com") for name in ("alice", "bob")]
+    sqlite_db.add_all([tournament, *users])
+    sqlite_db.flush()
+    games = [
+        Game(
+            tournament_id=tournament.id,
+            team1="A",
+            team2="B",
+            start_time=datetime(2026, 5, day),
+            team1_score=1,
+            team2_score=0,
+            finished=True,
+        )
+        for day in (1, 2, 3)
+    ]
+    sqlite_db.add_all(games)
+    sqlite_db.flush()
+    for game in games:
+        for user, points in zip(users, (5, 0)):
+            sqlite_db.add(
+                Bet(
+                    game_id=game.id,
+                    owner_id=user.id,
+                    owner_name=user.username,
+                    team1_score=1,
+                    team2_score=0,
+                    points=points,
+                    finished=True,
+                )
+            )
+    sqlite_db.commit()
+    return sqlite_db
+
+
+async def read_body(response) -> str:
+    return "".join([chunk async for chunk in response.body_iterator])
+
+
+@pytest.mark.asyncio
+async def test_bets_stream_as_ndjson_in_batches(export_db):
+    response = await export_bets(export_format="ndjson", tournament_id=None, user_id=None, since=None, until=None)
+    chunks = [chunk async for chunk in response.body_iterator]
+
+    rows = [json.loads(line) for line in "".join(chunks).splitlines()]
+    assert response.media_type == "application/x-ndjson"
+    assert len(chunks) == 3  # six bets, two per batch
+    assert [row["id"] for row in rows] == sorted(row["id"] for row in rows)
+    assert rows[0]["start_time"] == "2026-05-01T00:00:00"
+    assert rows[0]["tournament_name"] == "League"
+
+
+@pytest.mark.asyncio
+async def test_games_export_as_csv_filters_by_date_range(export_db):
+    response = await export_games(
+        export_format="csv",
+        tournament_id=None,
+        user_id=None,
+        since=datetime(2026, 5, 2),
+        until=datetime(2026, 5, 3),
+    )
+
+    rows = list(csv.DictReader(io.StringIO(await read_body(response))))
+    assert response.headers["content-disposition"] == 'attachment; filename="games.csv"'
+    assert [row["start_time"] for row in rows] == ["2026-05-02 00:00:00"]
+
+
+@pytest.mark.asyncio
+async def test_standings_export_aggregates_the_selected_games(export_db):
+    alice = export_db.query(User).filter(User.username == "alice").one()
+    response = await export_standings(
+        export_format="ndjson", tournament_id=None, user_id=alice.id, since=datetime(2026, 5, 2), until=None
+    )
+
+    [row] = [json.loads(line) for line in (await read_body(response)).splitlines()]
+    assert row["username"] == "alice"
+    assert row["total_points"] == 10
+    assert row["exact_score_count"] == 2
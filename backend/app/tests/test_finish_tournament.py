@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+
+from app.api.routers.tournament import finish_tournament
+from app.models.prize import Prize
+from app.models.team import tournament_team_association
+
+ADMIN = SimpleNamespace(id=1, is_admin=True)
+POINTS_BY_USER = {
+    "outcomes": [1, 1, 1, 1, 1, 1],  # 6 points, no exact score
+    "exact": [5, 1, 0, 0, 0, 0],  # 6 points with an exact score
+    "difference": [3, 3, 0, 0, 0, 0],  # 6 points, two goal differences
+    "leader": [5, 5, 0, 0, 0, 0],
+    "last": [0, 0, 0, 0, 0, 0],
+}
+
+
+@pytest.mark.asyncio
+async def test_finishing_ranks_players_with_the_leaderboard_tiebreakers(sqlite_db, seed_tournament):
+    # One finished game per round, every bet already scored as given
+    season = seed_tournament(
+        name="Season",
+        users=POINTS_BY_USER,
+        games=6,
+        finished=True,
+        bets={
+            username: [dict(team1_score=0, team2_score=0, points=bet_points, finished=True) for bet_points in points]
+            for username, points in POINTS_BY_USER.items()
+        },
+    )
+    tournament_id, user_ids = season.tournament.id, {user.username: user.id for user in season.users}
+
+    tournament = await finish_tournament(tournament_id, db=sqlite_db, current_user=ADMIN)
+
+    places = {
+        prize.user_id: (prize.place, prize.points, prize.tournament_name)
+        for prize in sqlite_db.query(Prize).filter(Prize.tournament_id == tournament_id)
+    }
+    assert places == {
+        user_ids["leader"]: (1, 10, "Season"),
+        user_ids["exact"]: (2, 6, "Season"),
+        user_ids["difference"]: (3, 6, "Season"),
+        user_ids["outcomes"]: (4, 6, "Season"),
+        user_ids["last"]: (5, 0, "Season"),
+    }
+    assert tournament.finished is True
+    assert not sqlite_db.execute(
+        select(tournament_team_association).where(tournament_team_association.c.tournament_id == tournament_id)
+    ).all()
@@ -0,0 +1,121 @@
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import event
+
+from app.api.crud.game import importable_matches
+from app.models.game import Game
+from app.models.team import Team
+from app.models.tournament import Tournament
+from app.scheduler import ingest
+from app.scheduler.ingest import announce_games, ingest_matches
+
+
+def test_importable_matches_only_looks_up_candidate_ids(sqlite_db):
+    tournament = Tournament(name="League")
+    sqlite_db.add(tournament)
+    sqlite_db.flush()
+    sqlite_db.add_all(
+        Game(tournament_id=tournament.id, team1="A", team2="B", start_time=datetime(2025, 5, 1), data_id=data_id)
+        for data_id in [1, 2, 500, 501]  # 500 and 501 belong to an old season
+    )
+    sqlite_db.commit()
+    matches = [
+        {"id": 1, "status": "TIMED"},
+        {"id": 2, "status": "FINISHED"},
+        {"id": 3, "status": "SCHEDULED"},
+        {"id": 4, "status": "FINISHED"},
+    ]
+
+    statements = []
+    event.listen(sqlite_db.get_bind(), "before_cursor_execute", lambda *args: statements.append((args[2], args[3])))
+    result = importable_matches(sqlite_db, matches)
+
+    assert result == [{"id": 3, "status": "SCHEDULED"}]
+    [(statement, parameters)] = statements
+    assert "IN" in statement and set(parameters) == {1, 3}
+
+
+def match_payload(match_id, home_id, away_id, status="SCHEDULED", season_id=7):
+    def team(team_id):
+        return {"id": team_id, "name": f"Team {team_id} FC" if team_id else None, "crest": f"{team_id}.png"}
+
+    return {
+        "id": match_id,
+        "status": status,
+        "stage": "REGULAR_SEASON",
+        "matchday": 7,
+        "season": {"id": season_id},
+        "utcDate": "2026-11-01T15:00:00Z",
+        "homeTeam": team(home_id),
+        "awayTeam": team(away_id),
+    }
+
+
+@pytest.mark.asyncio
+async def test_ingestion_imports_new_upcoming_matches_in_one_pass(sqlite_db):
+    last_season = Tournament(name="League 25/26", data_id=2021, season_id=6)
+    tracked = Tournament(name="League", data_id=2021, season_id=7)
+    tracked.teams.append(Team(name="Team 1", emblem="1.png", data_id=1))
+    finished = Tournament(name="Old league", data_id=2022, finished=True)
+    sqlite_db.add_all([last_season, tracked, finished])
+    sqlite_db.flush()
+    sqlite_db.add(
+        Game(tournament_id=tracked.id, team1="Team 1", team2="Team 2", start_time=datetime(2026, 10, 1), data_id=10)
+    )
+    sqlite_db.commit()
+    api = AsyncMock()
+    api.get_matches.return_value = {
+        "matches": [
+            match_payload(10, 1, 2, status="TIMED"),  # imported already
+            match_payload(11, 1, 3, status="TIMED"),
+            match_payload(12, 3, 4),
+            match_payload(13, 5, 6, status="FINISHED"),
+            match_payload(14, None, None),  # knockout round not drawn yet
+            match_payload(15, 1, 2, season_id=8),  # next season, not tracked yet
+        ]
+    }
+
+    games, report = await ingest_matches(sqlite_db, api)
+
+    assert api.get_matches.await_count == 2
+    # The unfinished tournament of the previous season, listed first, takes none of them
+    assert [(game.data_id, game.tournament.name) for game in games] == [(11, "League"), (12, "League")]
+    assert games[0].start_time == datetime(2026, 11, 1, 18, 0)
+    assert games[0].tournament.name == "League"
+    assert report["games"] == 2
+    assert sorted(team.data_id for team in sqlite_db.get(Tournament, tracked.id).teams) == [1, 3, 4]
+    assert sqlite_db.query(Team).filter(Team.data_id == 3).one().name == "Team 3"
+
+
+@pytest.mark.asyncio
+async def test_announcements_run_predictions_off_the_event_loop(monkeypatch):
+    notify = AsyncMock()
+    predicted = []
+    monkeypatch.setattr(ingest, "send_notifications", notify)
+    monkeypatch.setattr(ingest, "predict_game", lambda game_id: predicted.append((game_id, threading.current_thread())))
+    games = [SimpleNamespace(id=1, tournament=SimpleNamespace(name="League"))]
+
+    await announce_games(None, games)
+
+    notify.assert_awaited_once()
+    assert [game_id for game_id, _ in predicted] == [1]
+    assert predicted[0][1] is not threading.main_thread()
+
+
+@pytest.mark.asyncio
+async def test_tournament_without_a_season_adopts_the_current_one(sqlite_db):
+    tournament = Tournament(name="League", data_id=2021)
+    sqlite_db.add(tournament)
+    sqlite_db.commit()
+    api = AsyncMock()
+    api.get_matches.return_value = {"matches": [match_payload(11, 1, 2), match_payload(12, 1, 2, season_id=6)]}
+    api.get_competition.return_value = {"currentSeason": {"id": 7}}
+
+    games, _ = await ingest_matches(sqlite_db, api)
+
+    assert [game.data_id for game in games] == [11]
+    assert sqlite_db.get(Tournament, tournament.id).season_id == 7
@@ -0,0 +1,141 @@
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException, Response
+from fastapi.testclient import TestClient
+
+from app.api import conditional
+from app.api import snapshots as snapshots_module
+from app.api.routers.game import NEXT_GAMES_HEADER, conditional_game_list, get_games, get_open_games
+from app.api.snapshots import SnapshotCache
+from app.db.versions import VersionCache
+from app.models.bet import Bet
+from app.models.game import Game
+from app.models.tournament import Tournament
+from app.models.user import User
+
+LISTING_DEFAULTS = dict(finished=None, tournament_id=None, since=None, until=None, after=None, fields=None, expand=None)
+
+
+class StaticVersions:
+    def get(self, families):
+        return [(1, None) for _ in families]
+
+
+@pytest.fixture
+def season(seed_tournament):
+    """League id of five league games and one cup game, with a bet on the first league game."""
+    kickoff = datetime(2026, 5, 1, 18, 0)
+    # Two games per kickoff time, so the cursor has to break ties on the id
+    league = seed_tournament(
+        teams=("A", "B"),
+        kickoff=[kickoff + timedelta(days=i // 2) for i in range(5)],
+        bets={"player": [dict(team1_score=1, team2_score=0)]},
+    )
+    seed_tournament(name="Cup", teams=("C", "D"), team_ids=(3, 4), users=(), kickoff=kickoff)
+    return league.tournament.id
+
+
+async def list_games(db, **params):
+    response = Response()
+    del response.headers["content-length"]
+    games = await get_games(response, db=db, **{**LISTING_DEFAULTS, "limit": None, **params})
+    return json.loads(games.body), games.headers
+
+
+@pytest.mark.asyncio
+async def test_pages_follow_the_kickoff_cursor(sqlite_db, season):
+    league_id = season
+    pages, after = [], None
+    while True:
+        games, headers = await list_games(sqlite_db, tournament_id=league_id, after=after, limit=2)
+        pages.append(games)
+        after = headers.get(NEXT_GAMES_HEADER)
+        if after is None:
+            break
+
+    listed = [(game["start_time"], game["id"]) for page in pages for game in page]
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert listed == sorted(listed) and len(set(listed)) == 5
+    assert "bets" not in pages[0][0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("season")
+async def test_fields_and_bets_are_only_returned_on_request(sqlite_db, monkeypatch):
+    monkeypatch.setattr(snapshots_module, "data_versions", StaticVersions())
+    monkeypatch.setattr(snapshots_module, "snapshots", SnapshotCache())
+
+    sparse, _ = await list_games(sqlite_db, fields="id,team1", until=datetime(2026, 5, 2))
+    expanded, _ = await list_games(sqlite_db, fields="id", expand="bets", until=datetime(2026, 5, 2))
+
+    assert sparse == [{"id": 1, "team1": "A"}, {"id": 2, "team1": "A"}, {"id": 6, "team1": "C"}]
+    assert [len(game["bets"]) for game in expanded] == [1, 0, 0]
+    assert set(expanded[0]) == {"id", "bets"}
+
+
+@pytest.mark.asyncio
+async def test_unknown_fields_and_malformed_cursors_are_rejected(sqlite_db):
+    with pytest.raises(HTTPException) as unknown:
+        await list_games(sqlite_db, fields="id,password")
+    with pytest.raises(HTTPException) as malformed:
+        await list_games(sqlite_db, after="yesterday", limit=10)
+
+    assert unknown.value.status_code == malformed.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_open_games_leave_out_started_games_and_those_already_bet_on(sqlite_db):
+    tournament = Tournament(name="League")
+    player, other = User(username="player", email="player@example.com"), User(username="other", email="o@example.com")
+    sqlite_db.add_all([tournament, player, other])
+    sqlite_db.flush()
+    msk = datetime.utcnow() + timedelta(hours=3)
+    later, sooner, bet_on, started = [
+        Game(tournament_id=tournament.id, team1=name, team2="X", start_time=msk + delta)
+        for name, delta in (
+            ("later", timedelta(days=2)),
+            ("sooner", timedelta(days=1)),
+            ("bet on", timedelta(hours=1)),
+            ("started", -timedelta(minutes=5)),
+        )
+    ]
+    sqlite_db.add_all([later, sooner, bet_on, started])
+    sqlite_db.flush()
+    sqlite_db.add(Bet(game_id=bet_on.id, owner_id=player.id, owner_name="player", team1_score=1, team2_score=1))
+    sqlite_db.add(Bet(game_id=sooner.id, owner_id=other.id, owner_name="other", team1_score=1, team2_score=1))
+    sqlite_db.commit()
+
+    response = await get_open_games(db=sqlite_db, current_user=SimpleNamespace(id=player.id))
+
+    games = json.loads(response.body)
+    assert [game["team1"] for game in games] == ["sooner", "later"]
+    assert "bets" not in games[0]
+
+
+@pytest.mark.usefixtures("season")
+def test_placing_a_bet_only_changes_the_etag_of_lists_with_bets(sqlite_db, monkeypatch):
+    versions = VersionCache(sqlite_db.get_bind(), ttl=60)
+    monkeypatch.setattr(conditional, "data_versions", versions)
+    app = FastAPI()
+
+    @app.get("/games", dependencies=[Depends(conditional_game_list)])
+    def list_games():
+        return []
+
+    client = TestClient(app)
+    plain, expanded = client.get("/games"), client.get("/games", params={"expand": "bets"})
+    user = sqlite_db.query(User).one()
+    sqlite_db.add(Bet(game_id=2, owner_id=user.id, owner_name="player", team1_score=0, team2_score=0))
+    sqlite_db.commit()
+    versions.invalidate()
+
+    plain_again = client.get("/games", headers={"If-None-Match": plain.headers["etag"]})
+    expanded_again = client.get(
+        "/games", params={"expand": "bets"}, headers={"If-None-Match": expanded.headers["etag"]}
+    )
+
+    assert plain_again.status_code == 304
+    assert expanded_again.status_code == 200
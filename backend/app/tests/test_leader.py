@@ -0,0 +1,56 @@
+from datetime import timedelta
+from unittest.mock import Mock
+
+from sqlalchemy.exc import OperationalError
+
+from app.scheduler.leader import LeaderElection
+
+
+def make_worker(engine, name, lease_ttl=timedelta(seconds=45)):
+    election = LeaderElection(engine, lease_ttl=lease_ttl)
+    election.identity = name
+    return election
+
+
+def test_only_one_worker_becomes_leader(sqlite_db):
+    engine = sqlite_db.get_bind()
+    first, second = make_worker(engine, "worker-1"), make_worker(engine, "worker-2")
+
+    assert first.try_acquire() is True
+    assert second.try_acquire() is False
+    # The leader keeps renewing its lease
+    assert first.try_acquire() is True
+
+
+def test_released_leadership_is_taken_over(sqlite_db):
+    engine = sqlite_db.get_bind()
+    first, second = make_worker(engine, "worker-1"), make_worker(engine, "worker-2")
+    first.try_acquire()
+
+    first.release()
+
+    assert first.is_leader is False
+    assert second.try_acquire() is True
+
+
+def test_expired_lease_is_taken_over(sqlite_db):
+    engine = sqlite_db.get_bind()
+    dead = make_worker(engine, "worker-1", lease_ttl=timedelta(seconds=-1))
+    dead.try_acquire()
+
+    assert make_worker(engine, "worker-2").try_acquire() is True
+
+
+def test_failed_heartbeat_discards_the_locking_connection(sqlite_db):
+    election = make_worker(sqlite_db.get_bind(), "worker-1")
+    connection = Mock()
+    connection.execute.side_effect = OperationalError("SELECT 1", {}, Exception("statement timeout"))
+    election._connection = connection
+    election.engine = Mock(dialect=Mock())
+    election.engine.dialect.name = "postgresql"
+
+    assert election.try_acquire() is False
+    # A pooled connection would keep the session level lock after close()
+    connection.invalidate.assert_called_once()
+    connection.close.assert_not_called()
+    assert election._connection is None
@@ -0,0 +1,62 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.models.standing import TournamentStanding
+from app.scheduler.schedule import msk_now
+from app.utils.live_standings import ProvisionalStandings
+
+
+@pytest.fixture
+def live_game(sqlite_db, seed_tournament):
+    """Tournament id and a game leading 1:0 for half an hour; alice already has settled points."""
+    seeded = seed_tournament(
+        users=("alice", "bob"),
+        kickoff=msk_now() - timedelta(minutes=30),
+        bets={"alice": dict(team1_score=0, team2_score=2), "bob": dict(team1_score=1, team2_score=0)},
+        team1_score=1,
+        team2_score=0,
+    )
+    sqlite_db.add(
+        TournamentStanding(
+            tournament_id=seeded.tournament.id,
+            user_id=seeded.users[0].id,
+            total_points=4,
+            exact_score_count=0,
+            goal_difference_count=1,
+            correct_outcome_count=1,
+        )
+    )
+    sqlite_db.commit()
+    return seeded.tournament.id, seeded.games[0]
+
+
+def test_provisional_table_adds_live_points_to_persisted_standings(sqlite_db, live_game):
+    tournament_id, _ = live_game
+    standings = ProvisionalStandings()
+
+    table = standings.get(sqlite_db, tournament_id)
+
+    assert [(row["username"], row["total_points"], row["live_points"]) for row in table] == [
+        ("bob", 5, 5),
+        ("alice", 4, 0),
+    ]
+
+
+def test_refresh_reuses_cached_bets_and_follows_live_score(sqlite_db, live_game):
+    tournament_id, game = live_game
+    standings = ProvisionalStandings()
+    standings.refresh(sqlite_db)
+
+    game.team1_score, game.team2_score = 1, 3
+    sqlite_db.commit()
+    statements = []
+    event.listen(sqlite_db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    standings.refresh(sqlite_db)
+
+    assert not [statement for statement in statements if "FROM bets" in statement]
+    assert [(row["username"], row["total_points"]) for row in standings.get(sqlite_db, tournament_id)] == [
+        ("alice", 7),
+        ("bob", 0),
+    ]
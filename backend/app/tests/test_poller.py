@@ -0,0 +1,52 @@
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.scheduler.poller import fetch_matches_by_competition
+
+
+def make_game(game_id, data_id, competition_id, start_time=datetime(2024, 9, 1, 18, 0)):
+    return SimpleNamespace(
+        id=game_id,
+        data_id=data_id,
+        start_time=start_time,
+        tournament=SimpleNamespace(data_id=competition_id),
+    )
+
+
+@pytest.mark.asyncio
+async def test_games_of_one_competition_use_a_single_request():
+    api = AsyncMock()
+    api.get_competition_matches.return_value = {"matches": [{"id": 100 + i, "status": "IN_PLAY"} for i in range(10)]}
+    games = [make_game(i, 100 + i, 2021) for i in range(10)]
+
+    results = await fetch_matches_by_competition(api, games)
+
+    assert [match["id"] for match in results] == [game.data_id for game in games]
+    api.get_competition_matches.assert_awaited_once()
+    api.get_match.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_competition_request_falls_back_to_single_matches():
+    api = AsyncMock()
+    api.get_competition_matches.return_value = None
+    api.get_match.side_effect = lambda match_id: {"id": match_id, "status": "FINISHED"}
+    games = [make_game(1, 101, 2021), make_game(2, 102, None)]
+
+    results = await fetch_matches_by_competition(api, games)
+
+    assert [match["id"] for match in results] == [101, 102]
+    assert api.get_match.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_match_missing_from_competition_response_is_skipped():
+    api = AsyncMock()
+    api.get_competition_matches.return_value = {"matches": []}
+    games = [make_game(1, 101, 2021)]
+
+    assert await fetch_matches_by_competition(api, games) == [None]
+    api.get_match.assert_not_awaited()
@@ -0,0 +1,28 @@
+import asyncio
+import time
+
+import pytest
+
+from app.football_data.rate_limit import TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_up_to_capacity():
+    bucket = TokenBucket(rate=5, per=1)
+
+    started = time.monotonic()
+    for _ in range(5):
+        await bucket.acquire()
+
+    assert time.monotonic() - started < 0.1
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_throttles_after_burst():
+    bucket = TokenBucket(rate=10, per=1, capacity=1)
+
+    started = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+
+    # One token is available immediately, the other two are refilled at 10/s
+    assert time.monotonic() - started >= 0.18
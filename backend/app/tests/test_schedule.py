@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from app.api import MSK
+from app.db.versions import VersionCache
+from app.models.game import Game
+from app.models.tournament import Tournament
+from app.scheduler import jobs
+from app.scheduler.schedule import (
+    KICKOFF_LEAD,
+    LIVE_INTERVAL,
+    MAX_SLEEP,
+    OVERDUE_INTERVAL,
+    msk_now,
+    next_poll_time,
+    plan_next_poll,
+)
+
+NOW = datetime(2024, 9, 1, 18, 0)
+
+
+def test_live_game_polls_every_live_interval():
+    started = NOW - timedelta(minutes=40)
+    assert plan_next_poll(NOW, started, started, None) == NOW + LIVE_INTERVAL
+
+
+def test_idle_poller_wakes_just_before_next_kickoff():
+    kickoff = NOW + timedelta(minutes=20)
+    assert plan_next_poll(NOW, None, None, kickoff) == kickoff - KICKOFF_LEAD
+
+
+def test_idle_poller_sleeps_at_most_max_sleep():
+    assert plan_next_poll(NOW, None, None, NOW + timedelta(days=14)) == NOW + MAX_SLEEP
+    assert plan_next_poll(NOW, None, None, None) == NOW + MAX_SLEEP
+
+
+def test_overdue_game_is_rechecked_slowly():
+    overdue = NOW - timedelta(hours=5)
+    assert plan_next_poll(NOW, overdue, overdue, None) == NOW + OVERDUE_INTERVAL
+
+
+def test_next_poll_time_reads_unfinished_games(sqlite_db):
+    tournament = Tournament(name="League", data_id=2021)
+    sqlite_db.add(tournament)
+    sqlite_db.flush()
+    sqlite_db.add_all(
+        [
+            Game(
+                data_id=1,
+                tournament_id=tournament.id,
+                team1="A",
+                team2="B",
+                start_time=NOW - timedelta(days=1),
+                finished=True,
+            ),
+            Game(data_id=2, tournament_id=tournament.id, team1="C", team2="D", start_time=NOW + timedelta(minutes=30)),
+            Game(tournament_id=tournament.id, team1="E", team2="F", start_time=NOW - timedelta(minutes=10)),
+        ]
+    )
+    sqlite_db.commit()
+
+    assert next_poll_time(sqlite_db, now=NOW) == NOW + timedelta(minutes=30) - KICKOFF_LEAD
+
+
+def test_leader_brings_the_poller_forward_for_games_added_elsewhere(sqlite_db, monkeypatch):
+    planned = SimpleNamespace(next_run_time=(msk_now() + MAX_SLEEP).replace(tzinfo=MSK))
+    schedule = Mock()
+    monkeypatch.setattr(jobs, "data_versions", VersionCache(sqlite_db.get_bind(), ttl=0))
+    monkeypatch.setattr(jobs, "SessionLocal", lambda: sqlite_db)
+    monkeypatch.setattr(jobs, "scheduler", Mock(get_job=Mock(return_value=planned)))
+    monkeypatch.setattr(jobs, "schedule_game_statuses", schedule)
+    monkeypatch.setattr(jobs, "planned_games_version", None)
+    jobs.replan_after_game_changes()
+    schedule.assert_not_called()
+
+    # Another worker creates a game kicking off before the planned run
+    tournament = Tournament(name="League", data_id=2021)
+    sqlite_db.add(tournament)
+    sqlite_db.flush()
+    sqlite_db.add(
+        Game(data_id=1, tournament_id=tournament.id, team1="A", team2="B", start_time=msk_now() + KICKOFF_LEAD * 2)
+    )
+    sqlite_db.commit()
+    jobs.replan_after_game_changes()
+    jobs.replan_after_game_changes()
+
+    schedule.assert_called_once()
+    assert schedule.call_args.args[0] < planned.next_run_time.replace(tzinfo=None)
@@ -0,0 +1,54 @@
+from itertools import product
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.utils.bet_utils import calculate_bet_points, score_predictions
+
+
+def reference_points(bet_team1, bet_team2, game_team1, game_team2):
+    # The 5/3/1/0 rules written out branch by branch
+    if bet_team1 == game_team1 and bet_team2 == game_team2:
+        return 5
+    if bet_team1 - bet_team2 == game_team1 - game_team2:
+        return 3
+    if (bet_team1 > bet_team2 and game_team1 > game_team2) or (bet_team1 < bet_team2 and game_team1 < game_team2):
+        return 1
+    return 0
+
+
+@pytest.mark.parametrize(
+    "bet, game, points",
+    [
+        ((2, 1), (2, 1), 5),
+        ((3, 2), (2, 1), 3),
+        ((1, 1), (2, 2), 3),
+        ((3, 0), (1, 0), 1),
+        ((0, 2), (1, 4), 1),
+        ((1, 0), (0, 0), 0),
+        ((0, 1), (1, 0), 0),
+    ],
+)
+def test_calculate_bet_points(bet, game, points):
+    assert (
+        calculate_bet_points(
+            SimpleNamespace(team1_score=bet[0], team2_score=bet[1]),
+            SimpleNamespace(team1_score=game[0], team2_score=game[1]),
+        )
+        == points
+    )
+
+
+def test_kernel_matches_reference_rules_on_every_score_combination():
+    combinations = np.array(list(product(range(6), repeat=4)))
+
+    points = score_predictions(*combinations.T)
+
+    assert points.tolist() == [reference_points(*map(int, row)) for row in combinations]
+
+
+def test_kernel_broadcasts_one_result_over_many_bets():
+    points = score_predictions([2, 1, 0, 3], [1, 0, 0, 3], 2, 1)
+
+    assert points.tolist() == [5, 3, 0, 0]
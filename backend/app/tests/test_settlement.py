@@ -0,0 +1,138 @@
+from itertools import product
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event
+
+from app.api.crud.bet import upsert_bets
+from app.api.routers.game import delete_game
+from app.api.routers.tournament import get_leaderboard
+from app.models.bet import Bet
+from app.models.game import Game
+from app.models.standing import TournamentStanding
+from app.models.user import User
+from app.schemas.bet import BetCreate
+from app.utils.bet_utils import calculate_bet_points, settle_games
+from app.utils.rescore import rescore_bets
+
+SCORES = range(4)
+ADMIN = SimpleNamespace(id=0, is_admin=True)
+
+
+def players(count):
+    return [f"user{i}" for i in range(count)]
+
+
+def test_sql_scoring_matches_python_scoring(sqlite_db, seed_tournament):
+    predictions = list(product(SCORES, SCORES))
+    usernames = players(len(predictions))
+    bets = {
+        username: dict(team1_score=team1, team2_score=team2) for username, (team1, team2) in zip(usernames, predictions)
+    }
+    [game] = seed_tournament(users=usernames, bets=bets, team1_score=2, team2_score=1).games
+    # Settlement adds to the balance players already have
+    sqlite_db.query(User).update({User.total_points: 10})
+    sqlite_db.commit()
+
+    settle_games(sqlite_db, [game.id])
+    sqlite_db.commit()
+
+    bets = sqlite_db.query(Bet).filter(Bet.game_id == game.id).all()
+    for bet in bets:
+        assert bet.finished is True
+        assert bet.points == calculate_bet_points(bet, SimpleNamespace(team1_score=2, team2_score=1))
+        assert sqlite_db.get(User, bet.owner_id).total_points == 10 + bet.points
+    assert sqlite_db.get(Game, game.id).finished is True
+
+
+def test_settlement_statement_count_does_not_depend_on_bets(sqlite_db, seed_tournament):
+    usernames = players(50)
+    bets = {username: dict(team1_score=1, team2_score=1) for username in usernames}
+    game_id = seed_tournament(users=usernames, bets=bets, team1_score=1, team2_score=1).games[0].id
+
+    statements = []
+    event.listen(sqlite_db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    settle_games(sqlite_db, [game_id])
+    sqlite_db.commit()
+
+    assert len(statements) == 6  # five settlement statements and the data version bump on commit
+    assert {owner.total_points for owner in sqlite_db.query(User).all()} == {5}
+
+
+def test_settling_twice_credits_points_once(sqlite_db, seed_tournament):
+    seeded = seed_tournament(bets={"player": dict(team1_score=2, team2_score=0)}, team1_score=2, team2_score=0)
+    game_id, owner_id = seeded.games[0].id, seeded.users[0].id
+
+    assert settle_games(sqlite_db, [game_id]) == [game_id]
+    sqlite_db.commit()
+    assert settle_games(sqlite_db, [game_id]) == []
+    sqlite_db.commit()
+
+    assert sqlite_db.get(User, owner_id).total_points == 5
+    assert sqlite_db.get(Game, game_id).settlement_version == 1
+
+
+def test_rescore_fixes_points_after_score_correction(sqlite_db, seed_tournament):
+    bets = {"user0": dict(team1_score=1, team2_score=0), "user1": dict(team1_score=2, team2_score=2)}
+    [game] = seed_tournament(users=players(2), bets=bets, team1_score=1, team2_score=0).games
+    sqlite_db.query(User).update({User.total_points: 10})
+    sqlite_db.commit()
+    settle_games(sqlite_db, [game.id])
+    sqlite_db.commit()
+
+    game.team1_score, game.team2_score = 2, 2
+    sqlite_db.commit()
+    report = rescore_bets(sqlite_db, tournament_id=game.tournament_id, chunk_size=1)
+
+    assert report["bets_scanned"] == 2
+    assert report["bets_updated"] == 2
+    # Totals are rebuilt from settled bets only, dropping the starting balance of the seed
+    assert [user.total_points for user in sqlite_db.query(User).order_by(User.id)] == [0, 5]
+
+
+def test_rescore_settles_bets_left_unflagged_on_finished_games(sqlite_db, seed_tournament):
+    # A wrong prediction scores the 0 points already stored, only the flag is missing
+    seeded = seed_tournament(bets={"player": dict(team1_score=0, team2_score=3)}, team1_score=2, team2_score=0)
+    seeded.games[0].finished = True
+    sqlite_db.commit()
+
+    report = rescore_bets(sqlite_db, tournament_id=seeded.tournament.id)
+
+    assert report["bets_updated"] == 1
+    assert sqlite_db.query(Bet).one().finished is True
+    standing = sqlite_db.query(TournamentStanding).one()
+    assert (standing.user_id, standing.total_points) == (seeded.users[0].id, 0)
+
+
+def test_settlement_accumulates_tournament_standings(sqlite_db, seed_tournament):
+    bets = {"player": [dict(team1_score=2, team2_score=1), dict(team1_score=1, team2_score=0)]}
+    first, second = seed_tournament(games=2, bets=bets, team1_score=2, team2_score=1).games
+
+    settle_games(sqlite_db, [first.id])
+    sqlite_db.commit()
+    settle_games(sqlite_db, [second.id])
+    sqlite_db.commit()
+
+    standing = sqlite_db.query(TournamentStanding).one()
+    assert (standing.total_points, standing.exact_score_count, standing.goal_difference_count) == (8, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_lists_unsettled_bettors_and_follows_deleted_games(sqlite_db, seed_tournament):
+    seeded = seed_tournament(users=players(2), games=2, bets={"user0": [dict(team1_score=2, team2_score=1)]})
+    first, second = seeded.games
+    settled, waiting = seeded.users
+    first.team1_score, first.team2_score = 2, 1
+    sqlite_db.commit()
+    settle_games(sqlite_db, [first.id])
+    sqlite_db.commit()
+    upsert_bets(sqlite_db, waiting, [BetCreate(game_id=second.id, team1_score=0, team2_score=0)])
+    tournament_id, first_id, settled_id = first.tournament_id, first.id, settled.id
+
+    before = await get_leaderboard(tournament_id, db=sqlite_db, current_user=ADMIN)
+    await delete_game(first_id, db=sqlite_db, current_user=ADMIN)
+    after = await get_leaderboard(tournament_id, db=sqlite_db, current_user=ADMIN)
+
+    assert [(row.username, row.total_points) for row in before] == [("user0", 5), ("user1", 0)]
+    assert [(row.username, row.total_points) for row in after] == [("user1", 0)]
+    assert sqlite_db.get(User, settled_id).total_points == 0
@@ -0,0 +1,60 @@
+from fastapi import Response
+
+from app.api import snapshots as snapshots_module
+from app.api.snapshots import SnapshotCache, snapshot_response
+
+
+class StaticVersions:
+    def __init__(self):
+        self.version = 1
+
+    def get(self, families):
+        return [(self.version, None) for _ in families]
+
+
+def test_entries_are_served_only_for_the_versions_they_were_rendered_from():
+    cache = SnapshotCache(max_bytes=100)
+    cache.put("games", (1, 4), b"[]")
+
+    assert cache.get("games", (1, 4)) == b"[]"
+    assert cache.get("games", (2, 4)) is None
+    assert cache.size == 0
+
+
+def test_least_recently_used_entries_are_evicted_over_the_size_budget():
+    cache = SnapshotCache(max_bytes=10)
+    cache.put("a", (1,), b"aaaa")
+    cache.put("b", (1,), b"bbbb")
+    cache.get("a", (1,))
+    cache.put("c", (1,), b"cccc")
+    cache.put("huge", (1,), b"x" * 11)
+
+    assert list(cache.entries) == ["a", "c"]
+    assert cache.size == 8
+
+
+def test_snapshot_response_renders_once_per_data_version(monkeypatch):
+    versions = StaticVersions()
+    monkeypatch.setattr(snapshots_module, "data_versions", versions)
+    monkeypatch.setattr(snapshots_module, "snapshots", SnapshotCache())
+    renders = []
+
+    def render():
+        renders.append(versions.version)
+        return b'[{"id": %d}]' % len(renders)
+
+    def respond():
+        response = Response()
+        del response.headers["content-length"]
+        response.headers["ETag"] = 'W/"tag"'
+        return snapshot_response(("games", None), ["games"], render, response)
+
+    first, second = respond(), respond()
+    versions.version = 2
+    third = respond()
+
+    assert renders == [1, 2]
+    assert first.body == second.body == b'[{"id": 1}]'
+    assert third.body == b'[{"id": 2}]'
+    assert third.headers["etag"] == 'W/"tag"'
+    assert third.media_type == "application/json"
@@ -0,0 +1,63 @@
+from sqlalchemy import event, select
+
+from app.api.crud.team import sync_tournament_teams
+from app.models.area import Area
+from app.models.team import Team, tournament_team_association
+from app.models.tournament import Tournament
+
+
+def team_payload(team_id, name, area_id=2072):
+    return {
+        "id": team_id,
+        "name": name,
+        "crest": f"https://crests.football-data.org/{team_id}.png",
+        "area": {"id": area_id, "name": "England", "code": "ENG", "flag": "https://crests.football-data.org/770.svg"},
+    }
+
+
+def linked_team_ids(db, tournament_id):
+    return set(
+        db.execute(
+            select(tournament_team_association.c.team_id).where(
+                tournament_team_association.c.tournament_id == tournament_id
+            )
+        ).scalars()
+    )
+
+
+def test_league_import_takes_a_fixed_number_of_statements(sqlite_db):
+    tournament = Tournament(name="Premier League")
+    sqlite_db.add(tournament)
+    sqlite_db.commit()
+    tournament_id = tournament.id
+    league = [team_payload(team_id, f"Team {team_id} FC") for team_id in range(1, 21)]
+
+    statements = []
+    event.listen(sqlite_db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    linked = sync_tournament_teams(sqlite_db, tournament_id, league)
+
+    assert linked == 20
+    assert len(statements) == 4
+    assert sqlite_db.query(Area).count() == 1
+    assert {team.name for team in sqlite_db.query(Team)} == {f"Team {team_id}" for team_id in range(1, 21)}
+
+
+def test_resync_updates_teams_and_only_links_new_ones(sqlite_db):
+    tournament = Tournament(name="Premier League")
+    cup_team = Team(name="Cup guest", emblem="guest.png", data_id=99)
+    tournament.teams.append(cup_team)
+    sqlite_db.add(tournament)
+    sqlite_db.commit()
+    sync_tournament_teams(sqlite_db, tournament.id, [team_payload(1, "Arsenal FC"), team_payload(2, "Chelsea FC")])
+    sqlite_db.commit()
+
+    linked = sync_tournament_teams(
+        sqlite_db,
+        tournament.id,
+        [team_payload(1, "Arsenal"), team_payload(2, "Chelsea London FC"), team_payload(3, "Everton FC")],
+    )
+    sqlite_db.commit()
+
+    assert linked == 1
+    assert len(linked_team_ids(sqlite_db, tournament.id)) == 4  # the team linked by a game stays
+    assert sqlite_db.query(Team).filter(Team.data_id == 2).one().name == "Chelsea London"
@@ -0,0 +1,98 @@
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app.api.routers.tournament import get_tournament_summaries, get_tournament_summary, read_tournaments
+from app.models.area import Area
+from app.models.game import Game
+from app.models.prize import Prize
+from app.scheduler.schedule import msk_now
+
+BETTORS = ("user1", "user2", "user3")
+
+
+@pytest.fixture
+def seed_league(sqlite_db, seed_tournament):
+    """Seeds league ``number`` with a prize and ``games`` games won 1:0, each bet on by three players."""
+
+    def seed(number, games):
+        league = seed_tournament(
+            name=f"League {number}",
+            teams=(f"Home {number}", f"Away {number}"),
+            team_ids=(number * 10 + 1, number * 10 + 2),
+            team_area=Area(name=f"Area {number}", code=f"A{number}"),
+            users=BETTORS,
+            games=games,
+            bets={username: dict(team1_score=1, team2_score=0, points=0) for username in BETTORS},
+            team1_score=1,
+            team2_score=0,
+        ).tournament
+        league.prizes.append(Prize(place=1, points=10, user_id=1, tournament_name=league.name))
+        sqlite_db.commit()
+
+    return seed
+
+
+def count_listing_queries(db):
+    statements = []
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(db.get_bind(), "before_cursor_execute", listener)
+    try:
+        tournaments = read_tournaments(db)
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", listener)
+    return len(statements), tournaments
+
+
+def test_tournament_listing_query_count_does_not_grow_with_games(sqlite_db, seed_league):
+    seed_league(1, games=1)
+    small_count, _ = count_listing_queries(sqlite_db)
+    sqlite_db.expunge_all()
+
+    for number in range(2, 5):
+        seed_league(number, games=5)
+    large_count, tournaments = count_listing_queries(sqlite_db)
+
+    assert small_count == large_count == 6
+    game = tournaments[-1].games[0]
+    assert game.team1_emblem == "home4.png"
+    assert len(game.bets) == 3
+    assert game.bets[0].tournament_name == "League 4"
+
+
+@pytest.mark.asyncio
+async def test_summary_returns_counts_without_nested_data(sqlite_db, seed_league):
+    seed_league(1, games=2)
+    future_game = Game(tournament_id=1, team1="Home 1", team2="Away 1", start_time=msk_now() + timedelta(days=1))
+    sqlite_db.add(future_game)
+    sqlite_db.commit()
+
+    summary = await get_tournament_summary(1, expand=None, db=sqlite_db)
+
+    assert (summary.games_count, summary.open_games_count, summary.participants_count) == (3, 1, 3)
+    assert summary.games is None and summary.teams is None
+
+
+@pytest.mark.asyncio
+async def test_summary_expands_games_with_bets_on_request(sqlite_db, seed_league):
+    seed_league(1, games=2)
+
+    [without_bets] = await get_tournament_summaries(finished=None, expand="games", db=sqlite_db)
+    sqlite_db.expunge_all()
+    [with_bets] = await get_tournament_summaries(finished=None, expand="bets,teams", db=sqlite_db)
+
+    assert [len(game.bets) for game in without_bets.games] == [0, 0]
+    assert without_bets.teams is None
+    assert [len(game.bets) for game in with_bets.games] == [3, 3]
+    assert with_bets.games[0].team1_emblem == "home1.png"
+    assert sorted(team.name for team in with_bets.teams) == ["Away 1", "Home 1"]
+
+
+@pytest.mark.asyncio
+async def test_summary_rejects_unknown_expansions(sqlite_db):
+    with pytest.raises(HTTPException) as error:
+        await get_tournament_summaries(finished=None, expand="games,prizes", db=sqlite_db)
+
+    assert error.value.status_code == 400
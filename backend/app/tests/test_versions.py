@@ -0,0 +1,81 @@
+from datetime import datetime
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from app.api import conditional
+from app.api.conditional import conditional_get
+from app.db.versions import BETS, GAMES, TOURNAMENTS, VersionCache
+from app.models.bet import Bet
+from app.models.game import Game
+from app.models.tournament import Tournament
+
+
+@pytest.fixture
+def versions(sqlite_db, monkeypatch):
+    cache = VersionCache(sqlite_db.get_bind(), ttl=60)
+    monkeypatch.setattr(conditional, "data_versions", cache)
+    return cache
+
+
+def add_game(db):
+    tournament = Tournament(name="League")
+    db.add(tournament)
+    db.flush()
+    game = Game(tournament_id=tournament.id, team1="A", team2="B", start_time=datetime(2026, 5, 1, 18, 0))
+    db.add(game)
+    db.commit()
+    return game
+
+
+def test_commit_bumps_the_families_it_wrote(sqlite_db, versions):
+    add_game(sqlite_db)
+
+    (tournaments, _), (games, updated_at), (bets, _) = versions.get([TOURNAMENTS, GAMES, BETS])
+
+    assert (tournaments, games, bets) == (1, 1, 0)
+    assert updated_at is not None
+
+
+def test_bulk_updates_and_rollbacks(sqlite_db, versions):
+    game = add_game(sqlite_db)
+    sqlite_db.add(Bet(game_id=game.id, owner_id=1, owner_name="alice", team1_score=1, team2_score=0))
+    sqlite_db.commit()
+
+    sqlite_db.execute(update(Bet).values(points=5).execution_options(synchronize_session=False))
+    sqlite_db.commit()
+    game.team1_score = 3
+    sqlite_db.flush()
+    sqlite_db.rollback()
+    sqlite_db.commit()
+    versions.invalidate()
+
+    assert [version for version, _ in versions.get([GAMES, BETS])] == [1, 2]
+
+
+def test_unchanged_data_is_answered_with_not_modified(sqlite_db, versions):
+    calls = []
+    app = FastAPI()
+
+    @app.get("/games", dependencies=[Depends(conditional_get(GAMES, BETS))])
+    def list_games():
+        calls.append(1)
+        return []
+
+    client = TestClient(app)
+    first = client.get("/games")
+    etag = first.headers["etag"]
+    not_modified = client.get("/games", headers={"If-None-Match": etag})
+    other_user = client.get("/games", headers={"If-None-Match": etag, "Authorization": "Bearer other"})
+    add_game(sqlite_db)
+    versions.invalidate()  # what VERSION_TTL does for writes made by another worker
+    changed = client.get("/games", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200 and "last-modified" not in first.headers
+    assert not_modified.status_code == 304 and not_modified.headers["etag"] == etag
+    assert other_user.status_code == 200
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert "last-modified" in changed.headers
+    assert len(calls) == 3
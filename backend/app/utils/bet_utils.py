@@ -1,35 +1,220 @@
+import numpy as np
 from app.models.bet import Bet
 from app.models.game import Game
 from app.models.user import User
+from app.models.standing import TournamentStanding
+from app.db.upsert import dialect_insert
+from sqlalchemy import and_, case, delete, func, insert, literal_column, or_, select, update
 from sqlalchemy.orm import Session
 from typing import List
 
+EXACT_SCORE_POINTS = 5
+GOAL_DIFFERENCE_POINTS = 3
+OUTCOME_POINTS = 1
+
+STANDING_COLUMNS = [
+    "tournament_id",
+    "user_id",
+    "total_points",
+    "exact_score_count",
+    "goal_difference_count",
+    "correct_outcome_count",
+]
+
+
+def score_predictions(bet_team1_score, bet_team2_score, game_team1_score, game_team2_score) -> np.ndarray:
+    """Vectorized scoring kernel: score arrays of predictions against arrays of final scores.
+
+    Arguments broadcast against each other, so a whole season can be scored at once, or
+    every bet of one game against its scalar result.
+    """
+    bet_team1_score, bet_team2_score, game_team1_score, game_team2_score = (
+        np.asarray(score, dtype=np.int64)
+        for score in (bet_team1_score, bet_team2_score, game_team1_score, game_team2_score)
+    )
+    bet_difference = bet_team1_score - bet_team2_score
+    game_difference = game_team1_score - game_team2_score
+    return np.select(
+        [
+            (bet_team1_score == game_team1_score) & (bet_team2_score == game_team2_score),  # Exact score match
+            bet_difference == game_difference,  # Correct goal difference but not exact score
+            np.sign(bet_difference) == np.sign(game_difference),  # Correct outcome (win/loss)
+        ],
+        [EXACT_SCORE_POINTS, GOAL_DIFFERENCE_POINTS, OUTCOME_POINTS],
+        default=0,  # Incorrect prediction
+    )
+
 
 def calculate_bet_points(bet: Bet, game: Game) -> int:
-    if bet.team1_score == game.team1_score and bet.team2_score == game.team2_score:
-        return 5  # Exact score match
-    elif bet.team1_score - bet.team2_score == game.team1_score - game.team2_score:
-        return 3  # Correct goal difference but not exact score
-    elif (bet.team1_score > bet.team2_score and game.team1_score > game.team2_score) or (
-            bet.team1_score < bet.team2_score and game.team1_score < game.team2_score
-    ):
-        return 1  # Correct outcome (win/loss)
-    else:
-        return 0  # Incorrect prediction
-
-
-async def process_bets_for_finished_game(db: Session, game: Game) -> None:
-    bets = db.query(Bet).filter(Bet.game_id == game.id).all()
-    for bet in bets:
-        bet.points = calculate_bet_points(bet, game)
-        bet.finished = True
-
-    # Batch update users' total points
-    user_points = {}
-    for bet in bets:
-        user_points[bet.owner_id] = user_points.get(bet.owner_id, 0) + bet.points
-
-    for user_id, points in user_points.items():
-        db.query(User).filter(User.id == user_id).update({"total_points": User.total_points + points})
-
-    game.finished = True
\ No newline at end of file
+    return int(score_predictions(bet.team1_score, bet.team2_score, game.team1_score, game.team2_score))
+
+
+def bet_points_expression():
+    """SQL version of ``calculate_bet_points`` for bets joined with their game."""
+    return case(
+        (and_(Bet.team1_score == Game.team1_score, Bet.team2_score == Game.team2_score), EXACT_SCORE_POINTS),
+        (Bet.team1_score - Bet.team2_score == Game.team1_score - Game.team2_score, GOAL_DIFFERENCE_POINTS),
+        (
+            or_(
+                and_(Bet.team1_score > Bet.team2_score, Game.team1_score > Game.team2_score),
+                and_(Bet.team1_score < Bet.team2_score, Game.team1_score < Game.team2_score),
+            ),
+            OUTCOME_POINTS,
+        ),
+        else_=0,
+    )
+
+
+def claim_games_for_settlement(db: Session, game_ids: List[int]) -> List[int]:
+    """Lock the unsettled games among ``game_ids`` for the current transaction.
+
+    Rows already locked by another settlement are skipped rather than waited for, so
+    concurrent workers split the work instead of settling a game twice. SQLite ignores
+    ``FOR UPDATE`` and relies on its database-level write lock instead.
+    """
+    return list(
+        db.execute(
+            select(Game.id)
+            .where(Game.id.in_(game_ids), Game.finished == False)
+            .with_for_update(skip_locked=True)
+        ).scalars()
+    )
+
+
+def settle_games(db: Session, game_ids: List[int]) -> List[int]:
+    """Score every bet of the finished games and credit their owners with set-based updates.
+
+    Only games that could be claimed are settled and their ids are returned, which makes
+    repeated or concurrent calls for the same game a no-op. Settling costs the same few
+    statements whatever the number of games and bets; the caller commits, so scores,
+    totals, standings and the finished flags land in one transaction.
+    """
+    if not game_ids:
+        return []
+    db.flush()  # the final scores may still be pending on the session
+
+    game_ids = claim_games_for_settlement(db, game_ids)
+    if not game_ids:
+        return []
+
+    db.execute(
+        update(Bet)
+        .where(Bet.game_id == Game.id, Game.id.in_(game_ids))
+        .values(points=bet_points_expression(), finished=True)
+        .execution_options(synchronize_session=False)
+    )
+
+    game_points = (
+        select(Bet.owner_id, func.sum(Bet.points).label("points"))
+        .where(Bet.game_id.in_(game_ids))
+        .group_by(Bet.owner_id)
+        .subquery()
+    )
+    db.execute(
+        update(User)
+        .where(User.id == game_points.c.owner_id)
+        .values(total_points=User.total_points + game_points.c.points)
+        .execution_options(synchronize_session=False)
+    )
+
+    add_games_to_standings(db, game_ids)
+
+    db.execute(
+        update(Game)
+        .where(Game.id.in_(game_ids))
+        .values(finished=True, settlement_version=Game.settlement_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    # Keep objects already loaded in the session consistent with the updates above
+    db.expire_all()
+    return game_ids
+
+
+def standings_select(*criteria):
+    """Per tournament and user aggregates of settled bets, labelled and ordered as ``STANDING_COLUMNS``."""
+    return (
+        select(
+            Game.tournament_id.label("tournament_id"),
+            Bet.owner_id.label("user_id"),
+            func.coalesce(func.sum(Bet.points), 0).label("total_points"),
+            func.sum(case((Bet.points == EXACT_SCORE_POINTS, 1), else_=0)).label("exact_score_count"),
+            func.sum(case((Bet.points == GOAL_DIFFERENCE_POINTS, 1), else_=0)).label("goal_difference_count"),
+            func.sum(case((Bet.points == OUTCOME_POINTS, 1), else_=0)).label("correct_outcome_count"),
+        )
+        .join(Game, Bet.game_id == Game.id)
+        .where(Bet.finished == True, *criteria)
+        .group_by(Game.tournament_id, Bet.owner_id)
+    )
+
+
+def add_games_to_standings(db: Session, game_ids: List[int]) -> None:
+    """Add the freshly settled bets of ``game_ids`` to ``tournament_standings`` with one upsert."""
+    upsert = dialect_insert(db)(TournamentStanding).from_select(
+        STANDING_COLUMNS, standings_select(Bet.game_id.in_(game_ids))
+    )
+    db.execute(
+        upsert.on_conflict_do_update(
+            index_elements=[TournamentStanding.tournament_id, TournamentStanding.user_id],
+            set_={
+                column: getattr(TournamentStanding, column) + getattr(upsert.excluded, column)
+                for column in STANDING_COLUMNS[2:]
+            },
+        )
+    )
+
+
+def add_bettors_to_standings(db: Session, *criteria) -> None:
+    """Give the owners of the bets matching ``criteria`` an empty standing where they have none yet.
+
+    Leaderboards read ``tournament_standings`` alone, so players show up with zero points
+    as soon as they bet, before any of their games is settled.
+    """
+    bettors = (
+        select(Game.tournament_id, Bet.owner_id, *[literal_column("0")] * len(STANDING_COLUMNS[2:]))
+        .join(Game, Bet.game_id == Game.id)
+        .where(*criteria)
+        .group_by(Game.tournament_id, Bet.owner_id)
+    )
+    db.execute(
+        dialect_insert(db)(TournamentStanding)
+        .from_select(STANDING_COLUMNS, bettors)
+        .on_conflict_do_nothing(index_elements=[TournamentStanding.tournament_id, TournamentStanding.user_id])
+    )
+
+
+def rebuild_standings(db: Session, tournament_id: int | None = None) -> None:
+    """Recompute ``tournament_standings`` from settled bets, for one tournament or all of them.
+
+    Players whose bets are all still open keep their empty standing.
+    """
+    criteria = [] if tournament_id is None else [Game.tournament_id == tournament_id]
+    stale = delete(TournamentStanding)
+    if tournament_id is not None:
+        stale = stale.where(TournamentStanding.tournament_id == tournament_id)
+    db.execute(stale.execution_options(synchronize_session=False))
+    db.execute(insert(TournamentStanding).from_select(STANDING_COLUMNS, standings_select(*criteria)))
+    add_bettors_to_standings(db, *criteria)
+
+
+def ranked_standings_select(tournament_id: int):
+    """Final ranking of a tournament: ``user_id``, ``total_points`` and ``place`` from one aggregate.
+
+    Places follow the leaderboard tiebreakers, points then exact scores, goal differences
+    and outcomes; players still level are ordered by user id so places stay unique.
+    """
+    totals = standings_select(Game.tournament_id == tournament_id).subquery()
+    return select(
+        totals.c.user_id,
+        totals.c.total_points,
+        func.row_number()
+        .over(
+            order_by=(
+                totals.c.total_points.desc(),
+                totals.c.exact_score_count.desc(),
+                totals.c.goal_difference_count.desc(),
+                totals.c.correct_outcome_count.desc(),
+                totals.c.user_id,
+            )
+        )
+        .label("place"),
+    )
@@ -0,0 +1,125 @@
+import time
+import numpy as np
+from sqlalchemy.orm import Session
+from app.models.bet import Bet
+from app.models.game import Game
+from app.models.standing import TournamentStanding
+from app.models.user import User
+from app.scheduler.schedule import LIVE_INTERVAL, LIVE_WINDOW, msk_now
+from app.utils.bet_utils import EXACT_SCORE_POINTS, GOAL_DIFFERENCE_POINTS, OUTCOME_POINTS, score_predictions
+
+
+class ProvisionalStandings:
+    """Leaderboards of tournaments with games in play, as if those games ended now.
+
+    Bets cannot change after kickoff, so the bets of each live game are loaded once and
+    kept as arrays; every refresh only reads the live scores and the persisted standings
+    and rescores the cached bets with the vectorized kernel. Requests are served from the
+    last refresh, which the status poller triggers once per cycle.
+    """
+
+    def __init__(self, max_age: float = LIVE_INTERVAL.total_seconds()):
+        self.max_age = max_age
+        self.bets: dict[int, tuple[np.ndarray, np.ndarray, np.ndarray, list[str]]] = {}
+        self.tables: dict[int, list[dict]] = {}
+        self.refreshed_at: float | None = None
+
+    def get(self, db: Session, tournament_id: int) -> list[dict] | None:
+        """Provisional table of a tournament, or ``None`` when none of its games is live."""
+        if self.refreshed_at is None or time.monotonic() - self.refreshed_at > self.max_age:
+            # Only the leader's poller refreshes its own process, other workers catch up here
+            self.refresh(db)
+        return self.tables.get(tournament_id)
+
+    def refresh(self, db: Session) -> None:
+        now = msk_now()
+        live_games = (
+            db.query(Game.id, Game.tournament_id, Game.team1_score, Game.team2_score)
+            .filter(Game.finished == False, Game.start_time <= now, Game.start_time >= now - LIVE_WINDOW)
+            .all()
+        )
+        self._load_bets(db, [game.id for game in live_games])
+
+        tables = {}
+        for tournament_id in {game.tournament_id for game in live_games}:
+            games = [game for game in live_games if game.tournament_id == tournament_id]
+            tables[tournament_id] = self._build_table(db, tournament_id, games)
+
+        self.tables = tables
+        self.refreshed_at = time.monotonic()
+
+    def _load_bets(self, db: Session, game_ids: list[int]) -> None:
+        self.bets = {game_id: bets for game_id, bets in self.bets.items() if game_id in game_ids}
+        missing = [game_id for game_id in game_ids if game_id not in self.bets]
+        if not missing:
+            return
+
+        rows: dict[int, list] = {game_id: [] for game_id in missing}
+        for bet in db.query(Bet.game_id, Bet.owner_id, Bet.owner_name, Bet.team1_score, Bet.team2_score).filter(
+            Bet.game_id.in_(missing)
+        ):
+            rows[bet.game_id].append(bet)
+        for game_id, bets in rows.items():
+            self.bets[game_id] = (
+                np.array([bet.owner_id for bet in bets], dtype=np.int64),
+                np.array([bet.team1_score for bet in bets], dtype=np.int64),
+                np.array([bet.team2_score for bet in bets], dtype=np.int64),
+                [bet.owner_name for bet in bets],
+            )
+
+    def _build_table(self, db: Session, tournament_id: int, games: list) -> list[dict]:
+        table = {
+            standing.user_id: {
+                "username": standing.username,
+                "total_points": standing.total_points,
+                "live_points": 0,
+                "exact_score_count": standing.exact_score_count,
+                "goal_difference_count": standing.goal_difference_count,
+                "correct_outcome_count": standing.correct_outcome_count,
+            }
+            for standing in db.query(
+                TournamentStanding.user_id,
+                User.username,
+                TournamentStanding.total_points,
+                TournamentStanding.exact_score_count,
+                TournamentStanding.goal_difference_count,
+                TournamentStanding.correct_outcome_count,
+            )
+            .join(User, User.id == TournamentStanding.user_id)
+            .filter(TournamentStanding.tournament_id == tournament_id)
+        }
+
+        for game in games:
+            owner_ids, team1_scores, team2_scores, owner_names = self.bets[game.id]
+            points = score_predictions(team1_scores, team2_scores, game.team1_score or 0, game.team2_score or 0)
+            for owner_id, owner_name, bet_points in zip(owner_ids.tolist(), owner_names, points.tolist()):
+                row = table.setdefault(
+                    owner_id,
+                    {
+                        "username": owner_name,
+                        "total_points": 0,
+                        "live_points": 0,
+                        "exact_score_count": 0,
+                        "goal_difference_count": 0,
+                        "correct_outcome_count": 0,
+                    },
+                )
+                row["total_points"] += bet_points
+                row["live_points"] += bet_points
+                row["exact_score_count"] += bet_points == EXACT_SCORE_POINTS
+                row["goal_difference_count"] += bet_points == GOAL_DIFFERENCE_POINTS
+                row["correct_outcome_count"] += bet_points == OUTCOME_POINTS
+
+        return sorted(
+            table.values(),
+            key=lambda row: (
+                row["total_points"],
+                row["exact_score_count"],
+                row["goal_difference_count"],
+                row["correct_outcome_count"],
+            ),
+            reverse=True,
+        )
+
+
+provisional_standings = ProvisionalStandings()
@@ -0,0 +1,81 @@
+from sqlalchemy import Row, select
+from sqlalchemy.orm import Session, aliased
+from app.db.database import SessionLocal
+from app.db.versions import GAMES, TEAMS, TOURNAMENTS, data_versions
+from app.models.game import Game
+from app.models.team import Team
+from app.models.tournament import Tournament
+from app.scheduler.schedule import msk_now
+
+OPEN_GAME_FAMILIES = (GAMES, TEAMS, TOURNAMENTS)
+
+
+def game_details_select():
+    """Kickoff, teams with their emblems and tournament of games, the data a bet response needs."""
+    home, away = aliased(Team), aliased(Team)
+    return (
+        select(
+            Game.id,
+            Game.title,
+            Game.team1,
+            Game.team2,
+            Game.start_time,
+            Game.tournament_id,
+            Tournament.name.label("tournament_name"),
+            Tournament.logo.label("tournament_logo"),
+            home.emblem.label("team1_emblem"),
+            away.emblem.label("team2_emblem"),
+        )
+        .join(Tournament, Game.tournament_id == Tournament.id)
+        .outerjoin(home, Game.team1_id == home.data_id)
+        .outerjoin(away, Game.team2_id == away.data_id)
+    )
+
+
+class OpenGames:
+    """Details of the games that still accept bets, kept in memory for the bet write path.
+
+    The whole set is reloaded with one query whenever the games, teams or tournaments data
+    version moves, so creating, editing or deleting a game is picked up by this worker on
+    commit and by the others within the version TTL. Entries are not evicted at kickoff;
+    callers compare ``start_time`` themselves.
+    """
+
+    def __init__(self):
+        self.games: dict[int, Row] = {}
+        self.versions: tuple[int, ...] | None = None
+
+    def get(self, db: Session, game_id: int) -> Row | None:
+        """Details of a game, ``None`` when it does not exist."""
+        return self.get_many(db, [game_id]).get(game_id)
+
+    def get_many(self, db: Session, game_ids) -> dict[int, Row]:
+        """Details of the existing games among ``game_ids``, at most one query for those not in memory."""
+        versions = tuple(version for version, _ in data_versions.get(OPEN_GAME_FAMILIES))
+        if versions != self.versions:
+            self.load(db, versions)
+        games = {game_id: self.games[game_id] for game_id in game_ids if game_id in self.games}
+        # Started already, or added by another worker since the versions were read
+        missing = [game_id for game_id in game_ids if game_id not in games]
+        if missing:
+            games.update((row.id, row) for row in db.execute(game_details_select().where(Game.id.in_(missing))))
+        return games
+
+    def load(self, db: Session, versions: tuple[int, ...] | None = None) -> None:
+        if versions is None:
+            versions = tuple(version for version, _ in data_versions.get(OPEN_GAME_FAMILIES))
+        rows = db.execute(game_details_select().where(Game.finished == False, Game.start_time > msk_now())).all()
+        self.games = {row.id: row for row in rows}
+        self.versions = versions
+
+
+open_games = OpenGames()
+
+
+def warm_open_games() -> None:
+    """Fill the cache on startup so the first bets after a deploy do not pay for the load."""
+    db = SessionLocal()
+    try:
+        open_games.load(db)
+    finally:
+        db.close()
@@ -0,0 +1,112 @@
+"""Recompute bet points and user totals after scores were corrected.
+
+Usage from the backend directory:
+
+    python -m app.utils.rescore [--tournament-id ID] [--chunk-size N]
+"""
+
+import argparse
+import time
+import numpy as np
+from sqlalchemy import case, func, select, update
+from sqlalchemy.orm import Session
+from app.db.database import SessionLocal
+from app.models.bet import Bet
+from app.models.game import Game
+from app.models.user import User
+from app.models import area, prize, team, tournament  # noqa: F401 - mapped classes referenced by relationships
+from app.db import versions  # noqa: F401 - bumps the data versions of the rescored bets on commit
+from app.utils.bet_utils import rebuild_standings, score_predictions
+
+RESCORE_CHUNK_SIZE = 5000
+
+
+def rescore_bets(db: Session, tournament_id: int | None = None, chunk_size: int = RESCORE_CHUNK_SIZE) -> dict:
+    """Rescore the bets of finished games, then rebuild user totals and standings from scratch.
+
+    Bets are walked in ``Bet.id`` order in chunks of ``chunk_size``, scored with the
+    vectorized kernel and only the changed or not yet settled rows are written back, one
+    commit per chunk, so memory stays flat on the full history.
+    """
+    started = time.perf_counter()
+    query = (
+        select(
+            Bet.id,
+            func.coalesce(Bet.points, 0),
+            Bet.team1_score,
+            Bet.team2_score,
+            func.coalesce(Game.team1_score, 0),
+            func.coalesce(Game.team2_score, 0),
+            case((Bet.finished == True, 1), else_=0),
+        )
+        .join(Game, Bet.game_id == Game.id)
+        .where(Game.finished == True)
+        .order_by(Bet.id)
+        .limit(chunk_size)
+    )
+    if tournament_id is not None:
+        query = query.where(Game.tournament_id == tournament_id)
+
+    scanned = updated = 0
+    last_id = 0
+    while True:
+        rows = db.execute(query.where(Bet.id > last_id)).all()
+        if not rows:
+            break
+        chunk = np.array(rows, dtype=np.int64)
+        points = score_predictions(chunk[:, 2], chunk[:, 3], chunk[:, 4], chunk[:, 5])
+        # Unsettled bets of finished games are written back even when their stored points match
+        changed = (points != chunk[:, 1]) | (chunk[:, 6] == 0)
+        if changed.any():
+            db.execute(
+                update(Bet),
+                [
+                    {"id": int(bet_id), "points": int(bet_points), "finished": True}
+                    for bet_id, bet_points in zip(chunk[changed, 0], points[changed])
+                ],
+            )
+        db.commit()
+        scanned += len(rows)
+        updated += int(changed.sum())
+        last_id = int(chunk[-1, 0])
+
+    users = rebuild_user_totals(db)
+    rebuild_standings(db, tournament_id=tournament_id)
+    db.commit()
+
+    return {
+        "tournament_id": tournament_id,
+        "bets_scanned": scanned,
+        "bets_updated": updated,
+        "users_updated": users,
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def rebuild_user_totals(db: Session) -> int:
+    """Recompute ``users.total_points`` from all settled bets in a single statement."""
+    settled_points = (
+        select(func.coalesce(func.sum(Bet.points), 0))
+        .where(Bet.owner_id == User.id, Bet.finished == True)
+        .scalar_subquery()
+    )
+    return db.execute(
+        update(User).values(total_points=settled_points).execution_options(synchronize_session=False)
+    ).rowcount
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tournament-id", type=int, default=None, help="Rescore one tournament instead of all")
+    parser.add_argument("--chunk-size", type=int, default=RESCORE_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        print(rescore_bets(db, tournament_id=args.tournament_id, chunk_size=args.chunk_size))
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
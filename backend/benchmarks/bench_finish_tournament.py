@@ -0,0 +1,98 @@
+"""Latency and query count of ``POST /tournaments/{id}/finish`` on a seeded in-memory database.
+
+Usage from the backend directory:
+
+    python -m benchmarks.bench_finish_tournament [--games 380] [--players 300]
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.main  # noqa: F401 - registers every model on Base.metadata
+from app.api.routers.tournament import finish_tournament
+from app.db.database import Base
+from app.models.bet import Bet
+from app.models.game import Game
+from app.models.prize import Prize
+from app.models.tournament import Tournament
+from app.models.user import User
+from app.utils.bet_utils import score_predictions
+
+
+def seed(db, games: int, players: int) -> None:
+    db.execute(insert(Tournament), [{"id": 1, "name": "Season", "finished": False}])
+    db.execute(
+        insert(User),
+        [{"id": i, "username": f"user{i}", "email": f"user{i}@example.com"} for i in range(1, players + 1)],
+    )
+    kickoff = datetime(2026, 1, 1, 18, 0)
+    db.execute(
+        insert(Game),
+        [
+            {
+                "id": i,
+                "tournament_id": 1,
+                "team1": "Home",
+                "team2": "Away",
+                "start_time": kickoff + timedelta(hours=i),
+                "team1_score": i % 4,
+                "team2_score": i % 3,
+                "finished": True,
+            }
+            for i in range(1, games + 1)
+        ],
+    )
+    db.execute(
+        insert(Bet),
+        [
+            {
+                "game_id": game_id,
+                "owner_id": owner_id,
+                "owner_name": f"user{owner_id}",
+                "team1_score": (game_id + owner_id) % 4,
+                "team2_score": (game_id * owner_id) % 3,
+                "points": int(
+                    score_predictions((game_id + owner_id) % 4, (game_id * owner_id) % 3, game_id % 4, game_id % 3)
+                ),
+                "finished": True,
+            }
+            for game_id in range(1, games + 1)
+            for owner_id in range(1, players + 1)
+        ],
+    )
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=380)
+    parser.add_argument("--players", type=int, default=300)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    seed(db, args.games, args.players)
+    print(f"seeded {args.games} games, {args.players} players, {args.games * args.players} bets")
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *event_args: statements.append(event_args[2]))
+    started = time.perf_counter()
+    asyncio.run(finish_tournament(1, db=db, current_user=SimpleNamespace(id=1, is_admin=True)))
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"finish_tournament  queries={len(statements)}  elapsed={elapsed * 1000:.1f} ms  prizes={db.query(Prize).count()}"
+    )
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
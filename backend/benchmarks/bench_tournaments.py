@@ -0,0 +1,177 @@
+"""Query count and latency of ``GET /tournaments`` on a seeded in-memory database.
+
+Usage from the backend directory:
+
+    python -m benchmarks.bench_tournaments [--tournaments 10] [--games 500] [--bets 20000] [--repeat 5]
+
+Runs the endpoint with the current loader options and with the previous strategy
+(``joinedload`` of games, prizes and teams, bets lazy-loaded per game) for comparison.
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import joinedload, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.main  # noqa: F401 - registers every model on Base.metadata
+from app.api.routers import tournament as tournament_router
+from app.db.database import Base
+from app.models.area import Area
+from app.models.bet import Bet
+from app.models.game import Game
+from app.models.prize import Prize
+from app.models.team import Team, tournament_team_association
+from app.models.tournament import Tournament
+from app.models.user import User
+
+USERS = 200
+TEAMS_PER_TOURNAMENT = 20
+PRIZES_PER_TOURNAMENT = 3
+
+
+def joined_read_options():
+    # The loading strategy the endpoint used before switching to selectin loading
+    return (
+        joinedload(Tournament.games),
+        joinedload(Tournament.prizes),
+        joinedload(Tournament.teams).joinedload(Team.area),
+    )
+
+
+def seed(db, tournaments: int, games: int, bets: int) -> None:
+    db.execute(
+        insert(User), [{"id": i, "username": f"user{i}", "email": f"user{i}@example.com"} for i in range(1, USERS + 1)]
+    )
+    db.execute(insert(Area), [{"id": 1, "name": "Europe", "code": "EUR"}])
+    db.execute(
+        insert(Tournament),
+        [
+            {"id": i, "name": f"Tournament {i}", "logo": f"logo{i}.png", "finished": False}
+            for i in range(1, tournaments + 1)
+        ],
+    )
+
+    team_count = tournaments * TEAMS_PER_TOURNAMENT
+    db.execute(
+        insert(Team),
+        [
+            {"id": i, "name": f"Team {i}", "emblem": f"emblem{i}.png", "data_id": i, "area_id": 1}
+            for i in range(1, team_count + 1)
+        ],
+    )
+    db.execute(
+        insert(tournament_team_association),
+        [{"tournament_id": (i - 1) // TEAMS_PER_TOURNAMENT + 1, "team_id": i} for i in range(1, team_count + 1)],
+    )
+    db.execute(
+        insert(Prize),
+        [
+            {
+                "place": place,
+                "points": 100 - place,
+                "tournament_id": t,
+                "tournament_name": f"Tournament {t}",
+                "user_id": place,
+            }
+            for t in range(1, tournaments + 1)
+            for place in range(1, PRIZES_PER_TOURNAMENT + 1)
+        ],
+    )
+
+    kickoff = datetime(2026, 1, 1, 18, 0)
+    game_rows = []
+    for i in range(1, games + 1):
+        tournament_id = (i - 1) % tournaments + 1
+        first_team = (tournament_id - 1) * TEAMS_PER_TOURNAMENT + 1
+        team1_id = first_team + i % TEAMS_PER_TOURNAMENT
+        team2_id = first_team + (i + 1) % TEAMS_PER_TOURNAMENT
+        game_rows.append(
+            {
+                "id": i,
+                "tournament_id": tournament_id,
+                "title": f"Round {i}",
+                "team1": f"Team {team1_id}",
+                "team2": f"Team {team2_id}",
+                "team1_id": team1_id,
+                "team2_id": team2_id,
+                "start_time": kickoff + timedelta(hours=i),
+                "team1_score": i % 4,
+                "team2_score": i % 3,
+                "finished": i % 2 == 0,
+            }
+        )
+    db.execute(insert(Game), game_rows)
+    db.execute(
+        insert(Bet),
+        [
+            {
+                "game_id": i % games + 1,
+                "owner_id": i // games % USERS + 1,
+                "owner_name": f"user{i // games % USERS + 1}",
+                "team1_score": i % 3,
+                "team2_score": i % 2,
+                "points": 0,
+                "finished": False,
+                "hidden": False,
+            }
+            # one bet per player and game, bets cycle through the games first
+            for i in range(min(bets, games * USERS))
+        ],
+    )
+    db.commit()
+
+
+def measure(session_factory, repeat: int) -> tuple[int, float, int]:
+    """Query count of one call, best latency over ``repeat`` calls and the number of games returned."""
+    statements = []
+
+    def count(*args):
+        statements.append(args[2])
+
+    engine = session_factory.kw["bind"]
+    timings = []
+    for run in range(repeat):
+        db = session_factory()
+        if run == 0:
+            event.listen(engine, "before_cursor_execute", count)
+        started = time.perf_counter()
+        result = tournament_router.read_tournaments(db)
+        tournament_router.TOURNAMENT_LIST_ADAPTER.dump_json(result)
+        timings.append(time.perf_counter() - started)
+        if run == 0:
+            event.remove(engine, "before_cursor_execute", count)
+        db.close()
+    return len(statements), min(timings), sum(len(tournament.games) for tournament in result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tournaments", type=int, default=10)
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--bets", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = session_factory()
+    seed(db, args.tournaments, args.games, args.bets)
+    db.close()
+    print(f"seeded {args.tournaments} tournaments, {args.games} games, {args.bets} bets")
+
+    current_options = tournament_router.tournament_read_options
+    for label, options in (("joinedload + lazy bets", joined_read_options), ("selectinload", current_options)):
+        tournament_router.tournament_read_options = options
+        try:
+            queries, latency, games = measure(session_factory, args.repeat)
+        finally:
+            tournament_router.tournament_read_options = current_options
+        print(f"{label:<24} queries={queries:<5} best={latency * 1000:8.1f} ms  games={games}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Add games.settlement_version
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 10:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tables are created by Base.metadata.create_all on startup, so only touch existing ones
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table("games") and "settlement_version" not in {c["name"] for c in inspector.get_columns("games")}:
+        op.add_column("games", sa.Column("settlement_version", sa.Integer(), nullable=False, server_default="0"))
+
+
+def downgrade() -> None:
+    op.drop_column("games", "settlement_version")
@@ -0,0 +1,64 @@
+"""Create and backfill tournament_standings
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 12:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("bets"):
+        return  # fresh database, create_all builds the whole schema on startup
+    if not inspector.has_table("tournament_standings"):
+        op.create_table(
+            "tournament_standings",
+            sa.Column("tournament_id", sa.Integer(), sa.ForeignKey("tournaments.id"), primary_key=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), primary_key=True),
+            sa.Column("total_points", sa.Integer(), nullable=False),
+            sa.Column("exact_score_count", sa.Integer(), nullable=False),
+            sa.Column("goal_difference_count", sa.Integer(), nullable=False),
+            sa.Column("correct_outcome_count", sa.Integer(), nullable=False),
+        )
+        op.create_index(
+            "ix_tournament_standings_ranking",
+            "tournament_standings",
+            [
+                "tournament_id",
+                sa.text("total_points DESC"),
+                sa.text("exact_score_count DESC"),
+                sa.text("goal_difference_count DESC"),
+                sa.text("correct_outcome_count DESC"),
+            ],
+        )
+
+    # Backfill from bets settled before the table existed
+    op.execute("""
+        INSERT INTO tournament_standings
+            (tournament_id, user_id, total_points, exact_score_count, goal_difference_count, correct_outcome_count)
+        SELECT games.tournament_id, bets.owner_id, SUM(bets.points),
+               SUM(CASE WHEN bets.points = 5 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN bets.points = 3 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN bets.points = 1 THEN 1 ELSE 0 END)
+        FROM bets JOIN games ON games.id = bets.game_id
+        WHERE bets.finished = TRUE
+          AND NOT EXISTS (SELECT 1 FROM tournament_standings)
+        GROUP BY games.tournament_id, bets.owner_id
+        """)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tournament_standings_ranking", table_name="tournament_standings")
+    op.drop_table("tournament_standings")
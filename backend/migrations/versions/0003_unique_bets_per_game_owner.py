@@ -0,0 +1,61 @@
+"""Deduplicate bets and add a unique index on bets(game_id, owner_id)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 16:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if not inspector.has_table("bets"):
+        return  # fresh database, create_all builds the whole schema on startup
+    if "uq_bets_game_owner" in {index["name"] for index in inspector.get_indexes("bets")}:
+        return
+
+    # Keep the latest bet of every player on a game, earlier double submissions are dropped
+    deleted = bind.execute(sa.text("""
+            DELETE FROM bets
+            WHERE id NOT IN (SELECT MAX(id) FROM bets GROUP BY game_id, owner_id)
+            """)).rowcount
+    if deleted and inspector.has_table("users"):
+        # Same rebuild as rescore.rebuild_user_totals, the totals counted the dropped settled bets too
+        op.execute("""
+            UPDATE users SET total_points = (
+                SELECT COALESCE(SUM(bets.points), 0) FROM bets
+                WHERE bets.owner_id = users.id AND bets.finished = TRUE
+            )
+            """)
+    if deleted and inspector.has_table("tournament_standings"):
+        # Settled duplicates were counted in the standings, rebuild them from the remaining bets
+        op.execute("DELETE FROM tournament_standings")
+        op.execute("""
+            INSERT INTO tournament_standings
+                (tournament_id, user_id, total_points, exact_score_count, goal_difference_count, correct_outcome_count)
+            SELECT games.tournament_id, bets.owner_id, SUM(bets.points),
+                   SUM(CASE WHEN bets.points = 5 THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN bets.points = 3 THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN bets.points = 1 THEN 1 ELSE 0 END)
+            FROM bets JOIN games ON games.id = bets.game_id
+            WHERE bets.finished = TRUE
+            GROUP BY games.tournament_id, bets.owner_id
+            """)
+
+    op.create_index("uq_bets_game_owner", "bets", ["game_id", "owner_id"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("uq_bets_game_owner", table_name="bets")
@@ -0,0 +1,36 @@
+"""Index bets.owner_id and games.tournament_id
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 18:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# bets.game_id lookups are served by uq_bets_game_owner, whose first column it is
+INDEXES = {
+    "ix_bets_owner_id": ("bets", ["owner_id"]),
+    "ix_games_tournament_id": ("games", ["tournament_id"]),
+}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, (table, columns) in INDEXES.items():
+        if inspector.has_table(table) and name not in {index["name"] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, (table, _) in INDEXES.items():
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,38 @@
+"""Index games by kickoff and by tournament and status
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 20:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("games"):
+        return  # fresh database, create_all builds the whole schema on startup
+    existing = {index["name"] for index in inspector.get_indexes("games")}
+    if "ix_games_start_time" not in existing:
+        op.create_index("ix_games_start_time", "games", ["start_time"])
+    if "ix_games_tournament_finished" not in existing:
+        op.create_index("ix_games_tournament_finished", "games", ["tournament_id", "finished"])
+    # Superseded by the composite index, which starts with the same column
+    if "ix_games_tournament_id" in existing:
+        op.drop_index("ix_games_tournament_id", table_name="games")
+
+
+def downgrade() -> None:
+    op.create_index("ix_games_tournament_id", "games", ["tournament_id"])
+    op.drop_index("ix_games_tournament_finished", table_name="games")
+    op.drop_index("ix_games_start_time", table_name="games")
@@ -0,0 +1,69 @@
+"""Score and settle the bets of finished games
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 10:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Unsettled bets of finished games, and the points bet_points_expression gives them
+UNSETTLED = "(bets.finished IS NULL OR bets.finished = FALSE) AND games.id = bets.game_id AND games.finished = TRUE"
+BET_POINTS = """
+    CASE
+        WHEN bets.team1_score = games.team1_score AND bets.team2_score = games.team2_score THEN 5
+        WHEN bets.team1_score - bets.team2_score = games.team1_score - games.team2_score THEN 3
+        WHEN (bets.team1_score > bets.team2_score AND games.team1_score > games.team2_score)
+          OR (bets.team1_score < bets.team2_score AND games.team1_score < games.team2_score) THEN 1
+        ELSE 0
+    END
+"""
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if not inspector.has_table("bets"):
+        return  # fresh database, create_all builds the whole schema on startup
+
+    # Games finished through the old /games/finish path never settled their bets: they are neither
+    # scored nor flagged, and their owners were never credited. Credit first, while the bets still
+    # read as unsettled, then score and flag them in one statement.
+    op.execute(f"""
+        UPDATE users SET total_points = COALESCE(total_points, 0) + (
+            SELECT SUM({BET_POINTS}) FROM bets, games WHERE bets.owner_id = users.id AND {UNSETTLED}
+        )
+        WHERE id IN (SELECT bets.owner_id FROM bets, games WHERE {UNSETTLED})
+        """)
+    backfilled = bind.execute(sa.text(f"""
+            UPDATE bets SET points = {BET_POINTS}, finished = TRUE
+            FROM games
+            WHERE {UNSETTLED}
+            """)).rowcount
+    if backfilled and inspector.has_table("tournament_standings"):
+        op.execute("DELETE FROM tournament_standings")
+        op.execute("""
+            INSERT INTO tournament_standings
+                (tournament_id, user_id, total_points, exact_score_count, goal_difference_count, correct_outcome_count)
+            SELECT games.tournament_id, bets.owner_id, SUM(bets.points),
+                   SUM(CASE WHEN bets.points = 5 THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN bets.points = 3 THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN bets.points = 1 THEN 1 ELSE 0 END)
+            FROM bets JOIN games ON games.id = bets.game_id
+            WHERE bets.finished = TRUE
+            GROUP BY games.tournament_id, bets.owner_id
+            """)
+
+
+def downgrade() -> None:
+    pass  # which bets were settled by this migration is not recorded
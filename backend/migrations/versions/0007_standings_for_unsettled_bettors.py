@@ -0,0 +1,45 @@
+"""Give players without a settled bet an empty tournament standing
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-20 10:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("tournament_standings"):
+        return  # fresh database, create_all builds the whole schema on startup
+
+    # Placing a bet now creates the player's standing; the leaderboard reads standings alone
+    op.execute("""
+        INSERT INTO tournament_standings
+            (tournament_id, user_id, total_points, exact_score_count, goal_difference_count, correct_outcome_count)
+        SELECT games.tournament_id, bets.owner_id, 0, 0, 0, 0
+        FROM bets JOIN games ON games.id = bets.game_id
+        WHERE NOT EXISTS (
+            SELECT 1 FROM tournament_standings
+            WHERE tournament_standings.tournament_id = games.tournament_id
+              AND tournament_standings.user_id = bets.owner_id
+        )
+        GROUP BY games.tournament_id, bets.owner_id
+        """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        DELETE FROM tournament_standings
+        WHERE total_points = 0 AND exact_score_count = 0 AND goal_difference_count = 0 AND correct_outcome_count = 0
+        """)
@@ -68,7 +68,7 @@ function Home() {
         setIsLoading(true);
         setError(null);
         try {
-            const response = await axios.get(`${API_URL}/tournaments`);
+            const response = await axios.get(`${API_URL}/tournaments/summary`);
             const sortedTournaments = response.data.sort((a, b) => b.id - a.id);
             setTournaments(sortedTournaments);
             if (sortedTournaments.length > 0) {
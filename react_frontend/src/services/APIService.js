@@ -36,6 +36,7 @@ export const userService = {
 
 export const gameService = {
   getGames: () => api.get('/games'),
+  getOpenGames: () => api.get('/games/open'),
   placeBet: (gameId, betData) => api.post(`/games/${gameId}/bets`, betData),
 };
 